@@ -2,7 +2,7 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from config import ConfigParser, ConfigValidator, ConfigManager
-import sys, socket, requests, json, argparse
+import sys, socket, select, requests, json, argparse, threading
 
 class TaskmasterClient:
     """Client to communicate with Taskmaster server"""
@@ -11,13 +11,20 @@ class TaskmasterClient:
         self.method = method
         self.port = port
         self.host = host
+        # One kept-alive connection per client; the lock serializes the
+        # request/reply exchanges of threads sharing it
+        self._session = requests.Session() if method == 'http' else None
+        self._sock = None
+        self._reader = None
+        self._lock = threading.Lock()
+
     def send_http_command(self, command):
         """Send command via HTTP GET"""
         try:
             
             url = f"http://{self.host}:{self.port}/command"
             params = {'cmd': command}
-            response = requests.get(url, params=params, timeout=5)
+            response = self._session.get(url, params=params, timeout=5)
             
             if response.status_code == 200:
                 result = response.json()
@@ -28,17 +35,60 @@ class TaskmasterClient:
         except requests.RequestException as e:
             return False
     
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=5)
+        self._reader = self._sock.makefile('rb')
+
+    def _disconnect(self):
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+            self._sock = self._reader = None
+
+    def _exchange(self, command):
+        """Send one command and read its newline-terminated reply. Only a
+        send that fails on a kept connection is retried on a fresh one: once
+        the command has gone out it may have run, so it is never resent"""
+        if self._sock is not None and self._peer_closed():
+            self._disconnect()
+        if self._sock is None:
+            self._connect()
+            self._sock.sendall(f"{command}\n".encode())
+        else:
+            try:
+                self._sock.sendall(f"{command}\n".encode())
+            except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+                self._disconnect()
+                self._connect()
+                self._sock.sendall(f"{command}\n".encode())
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionResetError("connection closed by server")
+        return line
+
+    def _peer_closed(self):
+        """Tell, without blocking, whether the server has closed the kept connection"""
+        # recv() on a socket with a timeout waits for readability even with
+        # MSG_DONTWAIT, so only peek once select() says data or EOF is there.
+        readable, _, _ = select.select([self._sock], [], [], 0)
+        if not readable:
+            return False
+        try:
+            return self._sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT) == b''
+        except (BlockingIOError, InterruptedError, socket.timeout):
+            return False
+        except OSError:
+            return True
+
     def send_socket_command(self, command):
         """Send command via Socket"""
         try:
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.settimeout(5)
-            
-            client_socket.connect((self.host, self.port))
-
-            client_socket.send(f"{command}\n".encode())
-            response_text = client_socket.recv(4092).decode().strip()
-            client_socket.close()
+            with self._lock:
+                try:
+                    response_text = self._exchange(command).decode().strip()
+                except socket.error:
+                    self._disconnect()
+                    raise
             try:
                 return json.loads(response_text)
             except json.JSONDecodeError:
@@ -3,20 +3,39 @@ Taskmaster Control Shell
 Interactive urwid-based control interface for managing taskmaster processes.
 """
 
-import urwid, random, sys, os, argparse, time
+import urwid, sys, os, argparse, time
+from collections import deque
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from core import Taskmasterctl
 from config import ConfigManager
 from templates.help_templates import CommandHelpTemplates, CommandCategory  
-from templates.ui_templates import UITemplates
+from templates.ui_templates import (
+    UITemplates, BLANK_DIVIDER, DETAILS_TITLE, BASIC_INFO_HEADER, PROCESS_CONTROL_HEADER,
+    STDOUT_HEADER, ENV_HEADER, NOTIFICATIONS_HEADER, ON_FAILURE_LABEL, ON_SUCCESS_LABEL,
+    DETAILS_NAVIGATION,
+)
 
 # Application state
-current_view = "status"  # status, detail, help
-selected_program = None
-command_history = []
+command_history = deque(maxlen=1000)
 command_input = ""
 old_pathfile = None 
 
+# View refreshes requested within this window are rendered once
+REFRESH_DELAY = 0.05
+# Commands entered closer together than this (pastes, scripts) are a burst
+BURST_WINDOW = 0.02
+# A program status fetch is reused for this long
+PROGRAMS_TTL = 0.2
+
+# Footer shown with each refreshable view
+VIEW_FOOTERS = {
+    "status": "Type 'help' for available commands",
+    "help": "General Help - Type 'help <command>' for detailed command help",
+}
+
+# Command documentation is static; build it once instead of per help call
+COMMAND_HELP = CommandHelpTemplates.get_command_help()
+
 # Color palette
 palette = [
     ('header', 'white', 'dark blue'),
@@ -31,6 +50,18 @@ palette = [
 
 class TaskmasterUI:
     """Main UI class for the Taskmaster control shell"""
+
+    __slots__ = ("process_manager", "daemon", "method", "port", "host", "client",
+                 "programs", "filepath", "loop", "current_view", "header",
+                 "body_walker", "body", "footer", "command_edit", "footer_pile",
+                 "main_frame",
+                 "_dirty", "_alarm", "_pending_footer", "_programs_ts",
+                 "_last_command", "_burst", "_rendered_view", "_programs_changed",
+                 "_status_frame", "_status_names", "_status_rows", "_status_markup",
+                 "_help_prefix", "_help_suffix", "_help_programs_key",
+                 "_command_pages",
+                 "_sorted_key", "_sorted_pairs", "_unknown_help_tail",
+                 "_command_help_tail", "_commands")
     
     def __init__(self, process_manager=None, daemon=None, filepath='config_file/taskmaster.yaml'):
         """Initialize the TaskmasterUI instance"""
@@ -42,6 +73,68 @@ class TaskmasterUI:
         self.client = None
         self.programs = {}
         self.filepath = filepath
+        self.loop = None
+        self.current_view = "status"  # status, help
+        self._dirty = False
+        self._alarm = None
+        self._pending_footer = None
+        self._programs_ts = None
+        self._last_command = 0.0
+        self._burst = False
+        # View last drawn by refresh_view and whether programs changed since
+        self._rendered_view = None
+        self._programs_changed = True
+        # Header widgets plus the closing divider of the status view, rows go in between
+        self._status_frame = UITemplates.create_status_view({})
+        self._status_names = None
+        self._status_rows = {}
+        self._status_markup = {}
+        self._help_prefix = None
+        self._help_suffix = None
+        self._help_programs_key = None
+        self._command_pages = {}
+        self._sorted_key = None
+        self._sorted_pairs = []
+        # Constant trailers of the command help pages
+        self._unknown_help_tail = [
+            BLANK_DIVIDER,
+            urwid.Text(('header', "AVAILABLE COMMANDS:")),
+            urwid.Text(('success', "  Program Management:")),
+            urwid.Text("    start, stop, restart"),
+            urwid.Text(('info', "  Information & Monitoring:")),
+            urwid.Text("    status, detail"),
+            urwid.Text(('warning', "  Configuration & System:")),
+            urwid.Text("    reload, help, quit"),
+            BLANK_DIVIDER,
+            urwid.Text(('header', "SUGGESTIONS:")),
+            urwid.Text("  • Type 'help' to see the complete help overview"),
+            urwid.Text("  • Type 'help <command>' for detailed help on a specific command"),
+            urwid.Text("  • Check your spelling - commands are case-insensitive"),
+            BLANK_DIVIDER,
+            urwid.Text(('header', "NAVIGATION:")),
+            urwid.Text("  • Type 'help' to return to general help"),
+            urwid.Text("  • Type 'status' to return to main status view"),
+        ]
+        self._command_help_tail = [
+            BLANK_DIVIDER,
+            urwid.Text(('header', "NAVIGATION:")),
+            urwid.Text("  • Type 'help' to return to general help"),
+            urwid.Text("  • Type 'status' to return to main status view"),
+            urwid.Text("  • Type 'help <other_command>' for help on other commands"),
+        ]
+        self._commands = {
+            'quit': (self._cmd_quit, False),
+            'exit': (self._cmd_quit, False),
+            'status': (self._cmd_status, False),
+            'help': (self._cmd_help, False),
+            'detail': (self._cmd_detail, True),
+            'start': (self.handle_start_command, True),
+            'stop': (self.handle_stop_command, True),
+            'restart': (self.handle_restart_command, True),
+            'pid': (self._cmd_pid, False),
+            'version': (self._cmd_version, False),
+            'reload': (self._cmd_reload, False),
+        }
         self.setup()
 
 
@@ -58,9 +151,9 @@ class TaskmasterUI:
         if not self.client:
             sys.exit(1)
         if reload:
-            self.programs = self.get_programs()
+            self.refresh_programs(force=True)
         else :
-            self.programs = self.get_programs()
+            self.refresh_programs(force=True)
             self.setup_ui()
 
     def deamon_isAlive(self):
@@ -78,6 +171,14 @@ class TaskmasterUI:
     def get_programs(self):
         response = self.client.send_command('status')
         return response['data']
+
+    def refresh_programs(self, force=False):
+        """Fetch all program statuses unless the last fetch is younger than PROGRAMS_TTL."""
+        now = time.monotonic()
+        if force or self._programs_ts is None or now - self._programs_ts >= PROGRAMS_TTL:
+            self.programs = self.get_programs()
+            self._programs_ts = now
+            self._programs_changed = True
     
     def get_program(self, program_name):
         return self.programs.get(program_name, None)
@@ -112,64 +213,150 @@ class TaskmasterUI:
         self.refresh_view()
 
     def refresh_view(self):
-        if current_view == "status":
+        if self.current_view not in VIEW_FOOTERS:
+            return
+        if self.current_view == self._rendered_view and not self._programs_changed:
+            # Same view over the same data: only the footer may need restoring
+            self.footer.set_text(VIEW_FOOTERS[self.current_view])
+            return
+        self._programs_changed = False
+        self._rendered_view = self.current_view
+        if self.current_view == "status":
             self.show_status_view()
-        elif current_view == "help":
+        else:
             self.show_help_view()
 
+    def schedule_refresh(self, footer=None):
+        """Mark the view dirty; `footer` replaces the view's footer once rendered."""
+        self._dirty = True
+        if footer is not None:
+            self._pending_footer = footer
+        if self.loop is None:
+            self._flush()
+        elif self._alarm is None:
+            self._alarm = self.loop.set_alarm_in(REFRESH_DELAY, self._flush)
+
+    def set_footer(self, text):
+        """Show a command result; within an input burst only the last one is drawn."""
+        if self.loop is not None and (self._burst or self._alarm is not None):
+            self._pending_footer = text
+            if self._alarm is None:
+                self._alarm = self.loop.set_alarm_in(REFRESH_DELAY, self._flush)
+        else:
+            self.footer.set_text(text)
+
+    def cancel_refresh(self):
+        """Drop a pending refresh, for views that render themselves directly."""
+        self._rendered_view = None
+        self._dirty = False
+        self._pending_footer = None
+
+    def _flush(self, loop=None, user_data=None):
+        self._alarm = None
+        if self._dirty:
+            self._dirty = False
+            self.refresh_view()
+        if self._pending_footer is not None:
+            self.footer.set_text(self._pending_footer)
+            self._pending_footer = None
+
     def show_status_view(self):
         """Display the status overview of all programs"""
-        self.body_walker[:] = UITemplates.create_status_view(self.programs)
-        self.footer.set_text("Type 'help' for available commands")
+        rows, markups = self._status_rows, self._status_markup
+        showing = bool(self.body_walker) and self.body_walker[0] is self._status_frame[0]
+
+        # Reuse each program's row widget, rewriting it only when its line changed
+        widgets = []
+        for name, info in self.programs.items():
+            markup = UITemplates.create_status_row(name, info)
+            row = rows.get(name)
+            if row is None:
+                row = rows[name] = urwid.Text(markup)
+            elif markup != markups[name]:
+                row.set_text(markup)
+            markups[name] = markup
+            widgets.append(row)
+        for name in rows.keys() - self.programs.keys():
+            del rows[name], markups[name]
+
+        names = tuple(self.programs)
+        if not showing:
+            self.body_walker[:] = self._status_frame[:-1] + widgets + self._status_frame[-1:]
+        elif names != self._status_names:
+            # Programs were added or removed: splice just the row range
+            self.body_walker[len(self._status_frame) - 1:-1] = widgets
+        self._status_names = names
+        self.footer.set_text(VIEW_FOOTERS["status"])
 
    
     def show_help_view(self):
         """Display the general help overview"""
+        if self._help_prefix is None:
+            self._help_prefix, self._help_suffix = self._build_help_static()
+
+        # Only the programs section depends on state; skip the render if it is unchanged
+        programs_key, sorted_programs = self._sorted_programs()
+        if programs_key != self._help_programs_key or not self.body_walker or self.body_walker[0] is not self._help_prefix[0]:
+            self._help_programs_key = programs_key
+            self.body_walker[:] = self._help_prefix + self._build_help_programs(sorted_programs) + self._help_suffix
+        self.footer.set_text(VIEW_FOOTERS["help"])
+
+    def _build_help_static(self):
+        """Build the help widgets that never change: (before programs, after programs)"""
         help_sections = []
 
         # Overview
         help_sections.extend([
             urwid.Text(('title', "TASKMASTER CONTROL SHELL - HELP")),
-            urwid.Divider(),
+            BLANK_DIVIDER,
             urwid.Text(('header', "OVERVIEW:")),
             urwid.Text(f"  {CommandHelpTemplates.get_overview_help()}"),
-            urwid.Divider()
+            BLANK_DIVIDER
         ])
 
         # Commands by category
-        command_help = CommandHelpTemplates.get_command_help()
-        commands_by_category = {}
-        for cmd_name, cmd_info in command_help.items():
-            category = cmd_info['category']
-            if category not in commands_by_category:
-                commands_by_category[category] = []
-            commands_by_category[category].append((cmd_name, cmd_info['description']))
-
         help_sections.append(urwid.Text(('header', "AVAILABLE COMMANDS:")))
-        help_sections.append(urwid.Divider())
+        help_sections.append(BLANK_DIVIDER)
 
-        for category in CommandCategory:
-            if category in commands_by_category:
+        for category, commands in CommandHelpTemplates.get_category_index().items():
+            if commands:
                 color = 'success' if category == CommandCategory.PROGRAM_MANAGEMENT else \
                        'info' if category == CommandCategory.INFORMATION else 'warning'
                 help_sections.append(urwid.Text((color, f"{category.value}:")))
-                for cmd_name, description in sorted(commands_by_category[category]):
-                    syntax = command_help[cmd_name]['syntax']
+                for cmd_name, syntax, description in commands:
                     help_sections.append(urwid.Text(f"  {syntax:<20} - {description}"))
-                help_sections.append(urwid.Divider())
+                help_sections.append(BLANK_DIVIDER)
 
         # Command syntax help
         help_sections.append(urwid.Text(('header', "COMMAND SYNTAX:")))
         for syntax_help in CommandHelpTemplates.get_command_syntax_help():
             help_sections.append(urwid.Text(f"  • {syntax_help}"))
 
-        help_sections.append(urwid.Divider())
+        help_sections.append(BLANK_DIVIDER)
 
-        # Available programs section
-        if self.programs:
+        # Navigation help
+        navigation = [urwid.Text(('header', "NAVIGATION:"))]
+        for nav_help in CommandHelpTemplates.get_navigation_help():
+            navigation.append(urwid.Text(f"  • {nav_help}"))
+        navigation.append(BLANK_DIVIDER)
+        
+        navigation.append(urwid.Text(('info', "For detailed help on any command, type: help <command>")))
+        return help_sections, navigation
+
+    def _sorted_programs(self):
+        """Get (name, status) pairs as listed and sorted by name; re-sorted only on change"""
+        programs_key = tuple((name, info.get('status', 'unknown')) for name, info in self.programs.items())
+        if programs_key != self._sorted_key:
+            self._sorted_key = programs_key
+            self._sorted_pairs = sorted(programs_key)
+        return programs_key, self._sorted_pairs
+
+    def _build_help_programs(self, sorted_programs):
+        """Build the available programs section from sorted (name, status) pairs"""
+        help_sections = []
+        if sorted_programs:
             programs_by_status = {'running': [], 'stopped': [], 'exited': [], 'other': []}
-            for name, info in self.programs.items():
-                status = info.get('status', 'unknown')
+            for name, status in sorted_programs:
                 if status in programs_by_status:
                     programs_by_status[status].append(name)
                 else:
@@ -177,110 +364,62 @@ class TaskmasterUI:
 
             if any(programs_by_status.values()):
                 help_sections.append(urwid.Text(('header', "AVAILABLE PROGRAMS:")))
-                help_sections.append(urwid.Divider())
+                help_sections.append(BLANK_DIVIDER)
                 
                 if programs_by_status['running']:
-                    help_sections.extend(UITemplates.create_program_section("Running", programs_by_status['running'], 'success'))
+                    help_sections.extend(UITemplates.create_program_section("Running", programs_by_status['running'], 'success', presorted=True))
                 if programs_by_status['stopped']:
-                    help_sections.extend(UITemplates.create_program_section("Stopped", programs_by_status['stopped'], 'warning'))
+                    help_sections.extend(UITemplates.create_program_section("Stopped", programs_by_status['stopped'], 'warning', presorted=True))
                 if programs_by_status['exited']:
-                    help_sections.extend(UITemplates.create_program_section("Exited", programs_by_status['exited'], 'info'))
+                    help_sections.extend(UITemplates.create_program_section("Exited", programs_by_status['exited'], 'info', presorted=True))
                 if programs_by_status['other']:
-                    help_sections.extend(UITemplates.create_program_section("Other", programs_by_status['other']))
-                help_sections.append(urwid.Divider())
+                    help_sections.extend(UITemplates.create_program_section("Other", programs_by_status['other'], presorted=True))
+                help_sections.append(BLANK_DIVIDER)
         else:
             help_sections.extend([
                 urwid.Text(('warning', "No programs currently configured.")),
                 urwid.Text("Use 'reload' to load configuration or check your config file."),
-                urwid.Divider(),
+                BLANK_DIVIDER,
             ])
-
-        # Navigation help
-        help_sections.append(urwid.Text(('header', "NAVIGATION:")))
-        for nav_help in CommandHelpTemplates.get_navigation_help():
-            help_sections.append(urwid.Text(f"  • {nav_help}"))
-        help_sections.append(urwid.Divider())
-        
-        help_sections.append(urwid.Text(('info', "For detailed help on any command, type: help <command>")))
-
-        # Update the display
-        self.body_walker[:] = help_sections
-        self.footer.set_text("General Help - Type 'help <command>' for detailed command help")
+        return help_sections
 
     def show_command_help(self, command_name):
         """Show detailed help for a specific command"""
+        self.cancel_refresh()
+        Text = urwid.Text
         command_name = command_name.lower()
 
-        command_help = CommandHelpTemplates.get_command_help()
+        command_help = COMMAND_HELP
         if command_name not in command_help:
             self.body_walker[:] = [
-                urwid.Text(('title', f"COMMAND HELP - UNKNOWN COMMAND")),
-                urwid.Divider(),
-                urwid.Text(('error', f"ERROR: '{command_name}' is not a valid command.")),
-                urwid.Divider(),
-                urwid.Text(('header', "AVAILABLE COMMANDS:")),
-                urwid.Text(('success', "  Program Management:")),
-                urwid.Text("    start, stop, restart"),
-                urwid.Text(('info', "  Information & Monitoring:")),
-                urwid.Text("    status, detail"),
-                urwid.Text(('warning', "  Configuration & System:")),
-                urwid.Text("    reload, help, quit"),
-                urwid.Divider(),
-                urwid.Text(('header', "SUGGESTIONS:")),
-                urwid.Text("  • Type 'help' to see the complete help overview"),
-                urwid.Text("  • Type 'help <command>' for detailed help on a specific command"),
-                urwid.Text("  • Check your spelling - commands are case-insensitive"),
-                urwid.Divider(),
-                urwid.Text(('header', "NAVIGATION:")),
-                urwid.Text("  • Type 'help' to return to general help"),
-                urwid.Text("  • Type 'status' to return to main status view"),
-            ]
+                Text(('title', f"COMMAND HELP - UNKNOWN COMMAND")),
+                BLANK_DIVIDER,
+                Text(('error', f"ERROR: '{command_name}' is not a valid command.")),
+            ] + self._unknown_help_tail
             self.footer.set_text(f"Invalid command: '{command_name}' - Type 'help' for available commands")
             return
 
-        # Display detailed help for the command
-        help_info = command_help[command_name]
-        self.body_walker[:] = [
-            urwid.Text(('title', f"COMMAND HELP - {command_name.upper()}")),
-            urwid.Divider(),
-            urwid.Text(('header', "SYNTAX:")),
-            urwid.Text(('info', f"  {help_info['syntax']}")),
-            urwid.Divider(),
-            urwid.Text(('header', "DESCRIPTION:")),
-            urwid.Text(f"  {help_info['description']}"),
-            urwid.Divider(),
-            urwid.Text(('header', "PARAMETERS:")),
-            urwid.Text(f"  {help_info['parameters']}"),
-            urwid.Divider(),
-            urwid.Text(('header', "USAGE EXAMPLES:")),
-        ]
-
-        for i, example in enumerate(help_info['examples'], 1):
-            self.body_walker.append(urwid.Text(('success', f"  {i}. {example}")))
-
-        self.body_walker.extend([
-            urwid.Divider(),
-            urwid.Text(('header', "DETAILED INFORMATION:")),
-        ])
-
-        for detail in help_info['details']:
-            self.body_walker.append(urwid.Text(f"  • {detail}"))
+        # The documentation part of each page is static and built once; the
+        # rest is assembled in a plain list and handed to the walker in one
+        # assignment
+        page = self._command_pages.get(command_name)
+        if page is None:
+            page = self._command_pages[command_name] = self._build_command_page(command_name)
+        widgets = []
 
         # Add program names for commands that need them
         if command_name in ['start', 'stop', 'restart', 'detail']:
             if self.programs:
-                self.body_walker.extend([
-                    urwid.Divider(),
-                    urwid.Text(('header', "AVAILABLE PROGRAMS:")),
-                ])
+                widgets.append(BLANK_DIVIDER)
+                widgets.append(Text(('header', "AVAILABLE PROGRAMS:")))
 
-                # Group programs by status for better organization
+                # Group programs by status for better organization; the
+                # pairs are already sorted, so every bucket is too
                 running_programs = []
                 stopped_programs = []
                 other_programs = []
 
-                for name, info in self.programs.items():
-                    status = info.get('status', 'unknown')
+                for name, status in self._sorted_programs()[1]:
                     if status == 'running':
                         running_programs.append(name)
                     elif status == 'stopped':
@@ -288,36 +427,44 @@ class TaskmasterUI:
                     else:
                         other_programs.append(name)
 
-                if running_programs:
-                    self.body_walker.append(urwid.Text(('success', "  Running:")))
-                    for name in sorted(running_programs):
-                        self.body_walker.append(urwid.Text(f"    {name}"))
-
-                if stopped_programs:
-                    self.body_walker.append(urwid.Text(('warning', "  Stopped:")))
-                    for name in sorted(stopped_programs):
-                        self.body_walker.append(urwid.Text(f"    {name}"))
-
-                if other_programs:
-                    self.body_walker.append(urwid.Text(('info', "  Other:")))
-                    for name in sorted(other_programs):
-                        self.body_walker.append(urwid.Text(f"    {name}"))
+                for color, title, names in (('success', "  Running:", running_programs),
+                                            ('warning', "  Stopped:", stopped_programs),
+                                            ('info', "  Other:", other_programs)):
+                    if names:
+                        widgets.append(Text((color, title)))
+                        widgets.extend([Text(f"    {name}") for name in names])
             else:
-                self.body_walker.extend([
-                    urwid.Text(('warning', "  No programs currently available.")),
-                    urwid.Text("  Use 'reload' to load configuration."),
-                ])
+                widgets.append(Text(('warning', "  No programs currently available.")))
+                widgets.append(Text("  Use 'reload' to load configuration."))
 
-        self.body_walker.extend([
-            urwid.Divider(),
-            urwid.Text(('header', "NAVIGATION:")),
-            urwid.Text("  • Type 'help' to return to general help"),
-            urwid.Text("  • Type 'status' to return to main status view"),
-            urwid.Text("  • Type 'help <other_command>' for help on other commands"),
-        ])
+        self.body_walker[:] = page + widgets + self._command_help_tail
 
         self.footer.set_text(f"Detailed help for '{command_name}' command")
 
+    def _build_command_page(self, command_name):
+        """Build the documentation widgets of one command's help page"""
+        Text = urwid.Text
+        help_info = COMMAND_HELP[command_name]
+        widgets = [
+            Text(('title', f"COMMAND HELP - {command_name.upper()}")),
+            BLANK_DIVIDER,
+            Text(('header', "SYNTAX:")),
+            Text(('info', f"  {help_info['syntax']}")),
+            BLANK_DIVIDER,
+            Text(('header', "DESCRIPTION:")),
+            Text(f"  {help_info['description']}"),
+            BLANK_DIVIDER,
+            Text(('header', "PARAMETERS:")),
+            Text(f"  {help_info['parameters']}"),
+            BLANK_DIVIDER,
+            Text(('header', "USAGE EXAMPLES:")),
+        ]
+        widgets.extend([Text(('success', f"  {i}. {example}")) for i, example in enumerate(help_info['examples'], 1)])
+        widgets.append(BLANK_DIVIDER)
+        widgets.append(Text(('header', "DETAILED INFORMATION:")))
+        widgets.extend([Text(f"  • {detail}") for detail in help_info['details']])
+        return widgets
+
     
     def get_pid(self):
         pid_file = '/tmp/Taskmasterd.pid'
@@ -330,68 +477,68 @@ class TaskmasterUI:
     
     def handle_command(self, command):
         """Process and execute user commands"""
-        global current_view, selected_program
+        # Only the verb and the first argument are ever used; the verb is
+        # case-insensitive while program names keep their case
+        parts = command.split(None, 2)
+        if not parts:
+            return
 
-        command = command.strip().lower()
-        parts = command.split()
+        now = time.monotonic()
+        self._burst = now - self._last_command < BURST_WINDOW
+        self._last_command = now
 
-        if not parts:
+        cmd = parts[0].lower()
+        arg = parts[1] if len(parts) > 1 else ''
+
+        # Commands flagged True need a program/command argument
+        handler = self._commands.get(cmd)
+        if handler is None or (handler[1] and not arg):
+            self.set_footer(f"Unknown command: {command.strip()}. Type 'help' for available commands")
             return
+        handler[0](arg)
 
-        cmd = parts[0]
-        args = parts[1:] if len(parts) > 1 else []
+    def _cmd_quit(self, arg):
+        raise urwid.ExitMainLoop()
 
-        if cmd in ["quit", "exit"]:
-            raise urwid.ExitMainLoop()
-            
-        elif cmd == "status":
-            current_view = "status"
-            self.programs = self.get_programs()
-            self.refresh_view()
-            
-        elif cmd == "help":
-            if args:
-                self.show_command_help(args[0])
-            else:
-                current_view = "help"
-                self.refresh_view()
-                
-        elif cmd == "detail" and args:
-            program_name = args[0].strip()
-            if program_name in self.programs:
-                message = self.client.send_command(parts)
-                self.show_detail(message['data'], program_name)
-            else:
-                self.footer.set_text(f"Error: Program '{program_name}' not found")
-                
-        elif cmd == "start" and args:
-            self.handle_start_command(args[0])
-            
-        elif cmd == "stop" and args:
-            self.handle_stop_command(args[0])
-            
-        elif cmd == "restart" and args:
-            self.handle_restart_command(args[0])
-            
-        elif cmd == "pid":
-            pid = self.get_pid()
-            if pid:
-                self.footer.set_text(f"Taskmaster daemon PID: {pid}")
-            else:
-                self.footer.set_text("Taskmaster daemon is not running or PID file not found.")
-                
-        elif cmd == "version":
-            self.footer.set_text("Taskmaster Version: 1.1.1")
-            
-        elif cmd == "reload":
-            if not self.check_config_changemment():
-                self.footer.set_text(f"cannot change config server, please restart the application, only programs can be changed")
-            else:
-                self.handle_reload_command()
-                self.refresh_view()
-            
+    def _cmd_status(self, arg):
+        self.current_view = "status"
+        self.refresh_programs()
+        self.schedule_refresh()
+
+    def _cmd_help(self, arg):
+        if arg:
+            self.show_command_help(arg)
         else:
-            self.footer.set_text(f"Unknown command: {command}. Type 'help' for available commands")
+            self.current_view = "help"
+            self.schedule_refresh()
+
+    def _cmd_detail(self, arg):
+        program_name = arg
+        if program_name in self.programs:
+            message = self.client.send_command(['detail', program_name])
+            # The fetched entry is newer than the cached one; keep it
+            self.programs.update(message['data'])
+            self._programs_changed = True
+            self.show_detail(message['data'], program_name)
+        else:
+            self.set_footer(f"Error: Program '{program_name}' not found")
+
+    def _cmd_pid(self, arg):
+        pid = self.get_pid()
+        if pid:
+            self.set_footer(f"Taskmaster daemon PID: {pid}")
+        else:
+            self.set_footer("Taskmaster daemon is not running or PID file not found.")
+
+    def _cmd_version(self, arg):
+        self.set_footer("Taskmaster Version: 1.1.1")
+
+    def _cmd_reload(self, arg):
+        if not self.check_config_changemment():
+            self.set_footer(f"cannot change config server, please restart the application, only programs can be changed")
+        else:
+            self.handle_reload_command()
+            self.schedule_refresh()
 
     def check_config_changemment(self):
         Config = ConfigManager(self.filepath)
@@ -406,7 +553,7 @@ class TaskmasterUI:
     def check_program_cmd(self, program_name):
         program = self.get_program(program_name.strip())
         if not program:
-            self.footer.set_text(f"Error: Program '{program_name}' not found.")
+            self.set_footer(f"Error: Program '{program_name}' not found.")
             return False
         cmd = program.get('cmd', '')
         # if cmd:
@@ -433,90 +580,90 @@ class TaskmasterUI:
         
     def show_detail(self, data,program_name):
 
-        global current_view
-        # current_view = "detail"
-        self.body_walker[:] = [
-            urwid.Text(('title', f"Program Details")),
-            urwid.Divider(),
+        # self.current_view = "detail"
+        self.cancel_refresh()
+        Text = urwid.Text
+        program = data[program_name]
+        pget, cget = program.get, program.get('config', {}).get
+        # The page is built in a plain list and handed to the walker at once
+        widgets = [
+            DETAILS_TITLE,
+            BLANK_DIVIDER,
             # Basic Info Section
-            urwid.Text(('header', "Basic Information:")),
-            urwid.Text(f"Command: {data[program_name].get('cmd', 'N/A')}"),
-            urwid.Text(f"Status: {data[program_name].get('status', 'N/A')}"),
-            urwid.Text(f"PID: {data[program_name].get('pid', 'N/A')}"),
-            urwid.Text(f"Uptime: {data[program_name].get('uptime', 'N/A')} seconds"),
-            urwid.Text(f"Restarts: {data[program_name].get('restarts', 'N/A')}"),
-            urwid.Text(f"Number of Processes: {data[program_name]['config'].get('numprocs', 'N/A')}"),
-            urwid.Text(f"Umask: {data[program_name]['config'].get('umask', 'N/A')}"),
-            urwid.Text(f"User: {data[program_name]['config'].get('user', 'N/A')}"),
-            urwid.Text(f"Group: {data[program_name]['config'].get('group', 'N/A')}"),
-            urwid.Text(f"Priority: {data[program_name]['config'].get('priority', 'N/A')}"),
-            urwid.Text(f"Working Directory: {data[program_name]['config'].get('workingdir', 'N/A')}"),
-            urwid.Divider(),
+            BASIC_INFO_HEADER,
+            Text(f"Command: {pget('cmd', 'N/A')}"),
+            Text(f"Status: {pget('status', 'N/A')}"),
+            Text(f"PID: {pget('pid', 'N/A')}"),
+            Text(f"Uptime: {pget('uptime', 'N/A')} seconds"),
+            Text(f"Restarts: {pget('restarts', 'N/A')}"),
+            Text(f"Number of Processes: {cget('numprocs', 'N/A')}"),
+            Text(f"Umask: {cget('umask', 'N/A')}"),
+            Text(f"User: {cget('user', 'N/A')}"),
+            Text(f"Group: {cget('group', 'N/A')}"),
+            Text(f"Priority: {cget('priority', 'N/A')}"),
+            Text(f"Working Directory: {cget('workingdir', 'N/A')}"),
+            BLANK_DIVIDER,
             # Process Control Section
-            urwid.Text(('header', "Process Control:")),
-            urwid.Text(f"Autostart: {data[program_name]['config'].get('autostart', 'N/A')}"),
-            urwid.Text(f"Autorestart: {data[program_name]['config'].get('autorestart', 'N/A')}"),
-            urwid.Text(f"Exit Codes: {data[program_name]['config'].get('exitcodes', 'N/A')}"),
-            urwid.Text(f"Start Retries: {data[program_name]['config'].get('startretries', 'N/A')}"),
-            urwid.Text(f"Start Time: {data[program_name]['config'].get('startsecs', 'N/A')} seconds"),
-            urwid.Text(f"Stop Signal: {data[program_name]['config'].get('stopsignal', 'N/A')}"),
-            urwid.Text(f"Stop Time: {data[program_name]['config'].get('stoptsecs', 'N/A')} seconds"),
-            urwid.Divider(),
+            PROCESS_CONTROL_HEADER,
+            Text(f"Autostart: {cget('autostart', 'N/A')}"),
+            Text(f"Autorestart: {cget('autorestart', 'N/A')}"),
+            Text(f"Exit Codes: {cget('exitcodes', 'N/A')}"),
+            Text(f"Start Retries: {cget('startretries', 'N/A')}"),
+            Text(f"Start Time: {cget('startsecs', 'N/A')} seconds"),
+            Text(f"Stop Signal: {cget('stopsignal', 'N/A')}"),
+            Text(f"Stop Time: {cget('stoptsecs', 'N/A')} seconds"),
+            BLANK_DIVIDER,
         ]
 
         # Logging Section
         stdout = data.get('stdout', {})
         if isinstance(stdout, dict):
-            self.body_walker.extend([
-                urwid.Text(('header', "Stdout Configuration:")),
-                urwid.Text(f"  Path: {stdout.get('path', 'N/A')}"),
-                urwid.Text(f"  Max Bytes: {stdout.get('maxbytes', 'N/A')}")
-            ])
+            widgets.extend((
+                STDOUT_HEADER,
+                Text(f"  Path: {stdout.get('path', 'N/A')}"),
+                Text(f"  Max Bytes: {stdout.get('maxbytes', 'N/A')}")
+            ))
         else:
-            self.body_walker.append(urwid.Text(f"Stdout: {stdout}"))
+            widgets.append(Text(f"Stdout: {stdout}"))
 
-        self.body_walker.append(urwid.Text(f"Stderr: {data.get('stderr', 'N/A')}"))
-        self.body_walker.append(urwid.Divider())
+        widgets.append(Text(f"Stderr: {data.get('stderr', 'N/A')}"))
+        widgets.append(BLANK_DIVIDER)
 
         # Environment Variables Section
         env = data.get('env', {})
         if env:
-            self.body_walker.extend([
-                urwid.Text(('header', "Environment Variables:")),
-            ])
-            for key, value in env.items():
-                self.body_walker.append(urwid.Text(f"  {key}: {value}"))
-            self.body_walker.append(urwid.Divider())
+            widgets.append(ENV_HEADER)
+            widgets.extend([Text(f"  {key}: {value}") for key, value in env.items()])
+            widgets.append(BLANK_DIVIDER)
 
         # Notifications Section
         on_failure = data.get('on_failure', {}).get('smtp', {})
         on_success = data.get('on_success', {}).get('smtp', {})
 
         if on_failure or on_success:
-            self.body_walker.append(urwid.Text(('header', "Notifications:")))
+            widgets.append(NOTIFICATIONS_HEADER)
             
             if on_failure:
-                self.body_walker.extend([
-                    urwid.Text(('warning', "On Failure:")),
-                    urwid.Text(f"  Enabled: {on_failure.get('enabled', 'N/A')}"),
-                    urwid.Text(f"  Subject: {on_failure.get('subject', 'N/A')}"),
-                    urwid.Text(f"  From: {on_failure.get('from', 'N/A')}"),
-                    urwid.Text("  To: " + ", ".join(on_failure.get('to', ['N/A'])))
-                ])
+                widgets.extend((
+                    ON_FAILURE_LABEL,
+                    Text(f"  Enabled: {on_failure.get('enabled', 'N/A')}"),
+                    Text(f"  Subject: {on_failure.get('subject', 'N/A')}"),
+                    Text(f"  From: {on_failure.get('from', 'N/A')}"),
+                    Text("  To: " + ", ".join(on_failure.get('to', ['N/A'])))
+                ))
 
             if on_success:
-                self.body_walker.extend([
-                    urwid.Text(('success', "On Success:")),
-                    urwid.Text(f"  Enabled: {on_success.get('enabled', 'N/A')}"),
-                    urwid.Text(f"  Subject: {on_success.get('subject', 'N/A')}"),
-                    urwid.Text(f"  From: {on_success.get('from', 'N/A')}"),
-                    urwid.Text("  To: " + ", ".join(on_success.get('to', ['N/A'])))
-                ])
-
-        self.body_walker.extend([
-            urwid.Divider(),
-            urwid.Text(('info', "Press 'status' to return to the main view"))
-        ])
+                widgets.extend((
+                    ON_SUCCESS_LABEL,
+                    Text(f"  Enabled: {on_success.get('enabled', 'N/A')}"),
+                    Text(f"  Subject: {on_success.get('subject', 'N/A')}"),
+                    Text(f"  From: {on_success.get('from', 'N/A')}"),
+                    Text("  To: " + ", ".join(on_success.get('to', ['N/A'])))
+                ))
+
+        widgets.append(BLANK_DIVIDER)
+        widgets.append(DETAILS_NAVIGATION)
+        self.body_walker[:] = widgets
 
         self.footer.set_text("Viewing program details")
         
@@ -527,14 +674,14 @@ class TaskmasterUI:
             if program_name in self.programs and (
                 self.programs[program_name]['status'] in ['running', 'starting']
             ):
-                self.footer.set_text(f"Program '{program_name}' is already running.")
+                self.set_footer(f"Program '{program_name}' is already running.")
                 return
                 
             message = self.client.send_command(['start', program_name])
             self.programs[program_name] = message['data']
-            current_view = "status"
-            self.refresh_view()
-            self.footer.set_text(f"\nStart command sent: {message['message']}")
+            self._programs_changed = True
+            self.current_view = "status"
+            self.schedule_refresh(f"\nStart command sent: {message['message']}")
 
     def handle_stop_command(self, program_name):
         """Handle the stop command for a program"""
@@ -542,14 +689,14 @@ class TaskmasterUI:
             if program_name not in self.programs or (
                 self.programs[program_name]['status'] not in ['running', 'starting']
             ):
-                self.footer.set_text(f"Program '{program_name}' is not running.")
+                self.set_footer(f"Program '{program_name}' is not running.")
                 return
                 
             message = self.client.send_command(['stop', program_name])
             self.programs[program_name] = message['data']
-            current_view = "status"
-            self.refresh_view()
-            self.footer.set_text(f"\nStop command sent: {message['message']}")
+            self._programs_changed = True
+            self.current_view = "status"
+            self.schedule_refresh(f"\nStop command sent: {message['message']}")
 
     def handle_restart_command(self, program_name):
         """Handle the restart command for a program"""
@@ -562,15 +709,15 @@ class TaskmasterUI:
                 
             message = self.client.send_command(['restart', program_name])
             self.programs[program_name] = message['data']
-            current_view = "status"
-            self.refresh_view()
+            self._programs_changed = True
+            self.current_view = "status"
             
             if not was_running and message['data']['status'] == 'starting':
-                self.footer.set_text(
+                self.schedule_refresh(
                     f"\nStart command sent: program '{program_name}' was not running, so it was started."
                 )
             else:
-                self.footer.set_text(f"\nRestart command sent: {message['message']}")
+                self.schedule_refresh(f"\nRestart command sent: {message['message']}")
 
     def handle_reload_command(self):
         """Handle the reload command"""
@@ -580,8 +727,8 @@ class TaskmasterUI:
         
 
 def on_input(key):
-    # Always ensure focus is on command input
-    if ui.main_frame.focus_position != 'footer':
+    # Always ensure focus is on command input; only touch it if it drifted
+    if ui.main_frame.focus_position != 'footer' or ui.footer_pile.focus_position != 1:
         ui.main_frame.focus_position = 'footer'
         ui.footer_pile.focus_position = 1
 
@@ -591,18 +738,10 @@ def on_input(key):
             command_history.append(command)
             ui.handle_command(command)
             ui.command_edit.set_edit_text("")
-        # Keep focus on command input after processing command
-        ui.main_frame.focus_position = 'footer'
-        ui.footer_pile.focus_position = 1
         return True
     elif key in ('ctrl c', 'ctrl d'):
         raise urwid.ExitMainLoop()
 
-    # For any other key, make sure we're focused on command input
-    if ui.main_frame.focus_position != 'footer':
-        ui.main_frame.focus_position = 'footer'
-        ui.footer_pile.focus_position = 1
-
 # Color palette
 palette = [
     ('header', 'white', 'dark blue'),
@@ -615,9 +754,21 @@ palette = [
     ('normal', 'white', 'black'),
 ]
 
+def create_main_loop(ui):
+    """Create the main loop on an explicit raw screen and hand it to the UI"""
+    # The palette only uses the basic 16 colors; pinning them skips probing
+    # the terminal and keeps every frame in the short escape sequences
+    screen = urwid.raw_display.Screen()
+    screen.set_terminal_properties(colors=16)
+    loop = urwid.MainLoop(ui.main_frame, palette, screen=screen, unhandled_input=on_input)
+    ui.loop = loop
+    return loop
+
 class TaskmasterControlShell:
     """Main control shell class"""
 
+    __slots__ = ("process_manager", "daemon")
+
     def __init__(self, process_manager=None, daemon=None):
         self.process_manager = process_manager
         self.daemon = daemon
@@ -634,7 +785,7 @@ class TaskmasterControlShell:
         ui.footer_pile.focus_position = 1
 
         # Run the application
-        loop = urwid.MainLoop(ui.main_frame, palette, unhandled_input=on_input)
+        loop = create_main_loop(ui)
 
         try:
             loop.run()
@@ -664,7 +815,7 @@ if __name__ == "__main__":
     ui.footer_pile.focus_position = 1
     
     # Run the application
-    loop = urwid.MainLoop(ui.main_frame, palette, unhandled_input=on_input)
+    loop = create_main_loop(ui)
     loop.run()
 
 
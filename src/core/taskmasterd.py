@@ -45,12 +45,15 @@ class TaskmasterHTTPHandler(BaseHTTPRequestHandler):
                 return
 
             try:
-                response = process_command(command, args, self.taskmaster_server)
+                if command == 'status' and not args:
+                    body = self.taskmaster_server.process_commands.status_json()
+                else:
+                    body = json.dumps(process_command(command, args, self.taskmaster_server)).encode()
 
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(body)
             except Exception as e:
                 self.send_error(500, f"Error processing command: {str(e)}")
         else:
@@ -143,21 +146,28 @@ class SocketServer:
     def handle_client(self, client_socket, address):
         
         try:
-            while True:
-                data = client_socket.recv(1024).decode().strip()
+            # Commands are newline-delimited; one recv() may hold several
+            # commands, or only part of one.
+            reader = client_socket.makefile('rb')
+            for line in reader:
+                data = line.decode().strip()
                 if not data:
-                    break
+                    continue
                 try:
                     data_list = fix_socket_request(data)
                     command, args = parse_request(data_list)
-                    response = process_command(command, args, self.taskmaster_server)
+                    if command == 'status' and not args:
+                        body = self.taskmaster_server.process_commands.status_json()
+                    else:
+                        body = json.dumps(process_command(command, args, self.taskmaster_server)).encode()
                 except Exception as e:
                     response = {
                         "status": "error",
                         "message": f"Error processing command: {str(e)}",
                         "timestamp": datetime.now().isoformat()
                     }
-                client_socket.send(json.dumps(response).encode() + b'\n')
+                    body = json.dumps(response).encode()
+                client_socket.sendall(body + b'\n')
                 
         except Exception as e:
             print(f"Error handling socket client {address}: {e}")
@@ -185,6 +195,8 @@ class TaskmasterServer:
     
 
     def set_ProcessManager(self, config_manager, smtp_config=None):
+        self.process_commands.shutdown()
+        self.process_manager.shutdown()
         self.process_manager = ProcessManager(config_manager, smtp_config=smtp_config)
         self.smtp_notifier = SMTPNotifier(smtp_config)
         self.process_commands = ProcessCommands(self.process_manager)
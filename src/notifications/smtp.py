@@ -26,12 +26,12 @@ class SMTPNotifier:
                                 retry_count: int = 3) -> bool:
             """Send notification using predefined templates"""
             
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             if is_success:
-                template = NotificationTemplates.success_template(program_name, action)
+                template = NotificationTemplates.success_template(program_name, action, timestamp)
             else:
-                template = NotificationTemplates.failure_template(program_name, action, error_message or "Unknown error")
-            
-            body = template['body'].format(timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                template = NotificationTemplates.failure_template(program_name, action, error_message or "Unknown error", timestamp)
+            body = template['body']
             
             message = MIMEMultipart()
             message["Subject"] = template['subject']
@@ -4,127 +4,175 @@ This module provides command handling functionality for process control.
 """
 from typing import Dict, Any, Optional, List
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
 
 from .worker import ProcessWorker
 from .manager import ProcessManager
 
+def _now_iso(_now=datetime.now) -> str:
+    return _now().isoformat()
+
+# Status requests arriving within this window share one snapshot.
+_STATUS_BATCH_WINDOW = 0.002
+_STATUS_TIMEOUT = 5
+
+_MSG_NOT_FOUND = "Program '{}' not found"
+_MSG_OK = {
+    "start": "Program '{}' started successfully",
+    "stop": "Program '{}' stopped successfully",
+    "restart": "Program '{}' restarted successfully",
+}
+_MSG_FAILED = {
+    "start": "Failed to start program '{}'",
+    "stop": "Failed to stop program '{}'",
+    "restart": "Failed to restart program '{}'",
+}
+_MSG_STOP_FAILED = "Failed to stop program '{}' during restart"
+_MSG_ERROR = {
+    "start": "Error starting program '{}': {}",
+    "stop": "Error stopping program '{}': {}",
+    "restart": "Error restarting program '{}': {}",
+}
+
+def _respond(ok: bool, program_name: str, action: str, ts: str,
+             data: Optional[Dict[str, Any]] = None, err: Optional[str] = None) -> Dict[str, Any]:
+    """Build a command response; `err` is a failure reason or exception text."""
+    if ok:
+        message = _MSG_OK[action].format(program_name)
+    elif err == "not_found":
+        return {"status": "error", "message": _MSG_NOT_FOUND.format(program_name), "timestamp": ts}
+    elif err == "stop_failed":
+        return {"status": "error", "message": _MSG_STOP_FAILED.format(program_name), "timestamp": ts}
+    elif err == "failed":
+        message = _MSG_FAILED[action].format(program_name)
+    else:
+        return {"status": "error", "message": _MSG_ERROR[action].format(program_name, err), "timestamp": ts}
+    return {
+        "status": "success" if ok else "error",
+        "message": message,
+        "timestamp": ts,
+        "data": data
+    }
+
 class ProcessCommands:
     """Handles process control commands."""
 
+    __slots__ = ("manager", "logger", "_status_queue", "_status_thread")
+
     def __init__(self, manager: ProcessManager):
         self.manager = manager
         self.logger = logging.getLogger(__name__)
+        self._status_queue = queue.SimpleQueue()
+        self._status_thread = threading.Thread(target=self._status_batcher)
+        self._status_thread.daemon = True
+        self._status_thread.start()
+
+    def _status_batcher(self):
+        """Serve queued status requests from one get_all_status call per batch."""
+        status_queue = self._status_queue
+        running = True
+        while running:
+            request = status_queue.get()
+            if request is None:
+                return
+            batch = [request]
+            # Only a request that is already queued is worth waiting for.
+            if not status_queue.empty():
+                deadline = time.monotonic() + _STATUS_BATCH_WINDOW
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        request = status_queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if request is None:
+                        running = False
+                        break
+                    batch.append(request)
+            try:
+                snapshot = self.manager.get_all_status()
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for program_name, future in batch:
+                future.set_result(snapshot if program_name is None else snapshot.get(program_name, {}))
+
+    def shutdown(self):
+        """Stop the status batcher once the requests already queued are served."""
+        self._status_queue.put(None)
+
+    def _batched_status(self, program_name: Optional[str] = None) -> Dict[str, Any]:
+        future = Future()
+        self._status_queue.put((program_name, future))
+        return future.result(timeout=_STATUS_TIMEOUT)
 
     def start(self, program_name: str) -> Dict[str, Any]:
+        ts = _now_iso()
         try:
-            if not self.manager.program_exists(program_name):
-                return {
-                    "status": "error",
-                    "message": f"Program '{program_name}' not found",
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            result = self.manager.start_program(program_name)
-            return {
-                "status": "success" if result else "error",
-                "message": f"Program '{program_name}' started successfully" if result else f"Failed to start program '{program_name}'",
-                "timestamp": datetime.now().isoformat(),
-                "data": self.manager.get_program_status(program_name)
-            }
+            ok, reason, status = self.manager.start_program(program_name)
+            return _respond(ok, program_name, "start", ts, status, reason)
         except Exception as e:
-            self.logger.error(f"Error starting program {program_name}: {e}")
-            return {
-                "status": "error",
-                "message": f"Error starting program '{program_name}': {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
+            self.logger.error("Error starting program %s: %s", program_name, e)
+            return _respond(False, program_name, "start", ts, err=str(e))
 
     def stop(self, program_name: str) -> Dict[str, Any]:
+        ts = _now_iso()
         try:
-            if not self.manager.program_exists(program_name):
-                return {
-                    "status": "error",
-                    "message": f"Program '{program_name}' not found",
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            result = self.manager.stop_program(program_name)
-            return {
-                "status": "success" if result else "error",
-                "message": f"Program '{program_name}' stopped successfully" if result else f"Failed to stop program '{program_name}'",
-                "timestamp": datetime.now().isoformat(),
-                "data": self.manager.get_program_status(program_name)
-            }
+            ok, reason, status = self.manager.stop_program(program_name)
+            return _respond(ok, program_name, "stop", ts, status, reason)
         except Exception as e:
-            self.logger.error(f"Error stopping program {program_name}: {e}")
-            return {
-                "status": "error",
-                "message": f"Error stopping program '{program_name}': {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
+            self.logger.error("Error stopping program %s: %s", program_name, e)
+            return _respond(False, program_name, "stop", ts, err=str(e))
 
     def restart(self, program_name: str) -> Dict[str, Any]:
+        ts = _now_iso()
         try:
-            if not self.manager.program_exists(program_name):
-                return {
-                    "status": "error",
-                    "message": f"Program '{program_name}' not found",
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            stop_result = self.manager.stop_program(program_name)
-            if not stop_result:
-                return {
-                    "status": "error",
-                    "message": f"Failed to stop program '{program_name}' during restart",
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            start_result = self.manager.restart_program(program_name)
-            return {
-                "status": "success" if start_result else "error",
-                "message": f"Program '{program_name}' restarted successfully" if start_result else f"Failed to restart program '{program_name}'",
-                "timestamp": datetime.now().isoformat(),
-                "data": self.manager.get_program_status(program_name)
-                
-            }
+            ok, reason, status = self.manager.restart_program(program_name)
+            return _respond(ok, program_name, "restart", ts, status, reason)
         except Exception as e:
-            self.logger.error(f"Error restarting program {program_name}: {e}")
-            return {
-                "status": "error",
-                "message": f"Error restarting program '{program_name}': {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
+            self.logger.error("Error restarting program %s: %s", program_name, e)
+            return _respond(False, program_name, "restart", ts, err=str(e))
+
+    def status_json(self) -> bytes:
+        """Get the status of all programs as an encoded response, for the transports."""
+        ts = _now_iso()
+        return b'{"status": "success", "data": ' + self.manager.status_json() + b', "timestamp": "' + ts.encode() + b'"}'
 
     def status(self, program_name: Optional[str] = None) -> Dict[str, Any]:
         """Get program status."""
+        ts = _now_iso()
         try:
             if program_name:
-                if not self.manager.program_exists(program_name):
+                status_data = self._batched_status(program_name)
+                if not status_data:
                     return {
                         "status": "error",
-                        "message": f"Program '{program_name}' not found",
-                        "timestamp": datetime.now().isoformat()
+                        "message": _MSG_NOT_FOUND.format(program_name),
+                        "timestamp": ts
                     }
-                status_data = self.manager.get_program_status(program_name)
-                #print(f"Status data for {program_name}: {status_data}")
                 return {
                     "status": "success",
                     "data": {program_name: status_data},
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": ts
                 }
             else:
-                all_statuses = self.manager.get_all_status()
+                all_statuses = self._batched_status()
                 return {
                     "status": "success",
                     "data": all_statuses,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": ts
                 }
         except Exception as e:
-            self.logger.error(f"Error getting status for {program_name or 'all programs'}: {e}")
+            self.logger.error("Error getting status for %s: %s", program_name or 'all programs', e)
             return {
                 "status": "error",
                 "message": f"Error getting status: {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
\ No newline at end of file
+                "timestamp": ts
+            }
@@ -2,24 +2,36 @@
 
 This module handles process lifecycle management and status tracking.
 """
-import os
-import signal
+import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
-from .worker import ProcessWorker
+from .worker import ProcessWorker, LIVE_STATES
 from .monitor import ProcessMonitor
 
 class ProcessManager:
     """Manages process lifecycle and status."""
 
+    __slots__ = ("config_manager", "smtp_config", "logger", "processes", "pids", "lock",
+                 "_status_cache", "revision", "_status_parts", "_status_parts_revision",
+                 "_spawn_pool", "monitor")
+
     def __init__(self, config_manager, smtp_config=None):
         """Initialize the process manager."""
         self.config_manager = config_manager
         self.smtp_config = smtp_config
         self.logger = logging.getLogger(__name__)
         self.processes: Dict[str, ProcessWorker] = {}
+        self.pids: Dict[int, ProcessWorker] = {}
+        self.lock = threading.Lock()
+        self._status_cache: Dict[str, Dict[str, Any]] = {}
+        self.revision = 0
+        self._status_parts: List[Tuple[str, bytes]] = []
+        self._status_parts_revision = -1
+        self._spawn_pool = ThreadPoolExecutor(max_workers=32)
         self.monitor = ProcessMonitor(self)
         self.load_programs()
         self.start_all_autostart()
@@ -34,61 +46,157 @@ class ProcessManager:
     def load_programs(self):
         """Load program configurations and initialize workers."""
         programs = self.config_manager.get_all_program_configs()
+        procs = self.processes
         for name, config in programs.items():
-            self.processes[name] = ProcessWorker(name, config, self)
+            worker = procs[name] = ProcessWorker(name, config, self)
+            self.update_status(worker)
     
     def program_exists(self, program_name: str) -> bool:
         """Check if a program exists in configuration."""
         return program_name in self.processes
 
-    def start_program(self, program_name: str) -> bool:
-        """Start a program."""
-        if not self.program_exists(program_name):
-            self.logger.error(f"Program '{program_name}' not found")
-            return False
-
-        worker = self.processes[program_name]
-        return worker.start()
-
-    def stop_program(self, program_name: str) -> bool:
-        """Stop a program."""
-        if not self.program_exists(program_name):
-            self.logger.error(f"Program '{program_name}' not found")
-            return False
-
-        worker = self.processes[program_name]
-        return worker.stop()
-
-    def restart_program(self, program_name: str) -> bool:
-        """Restart a program."""
-        if not self.program_exists(program_name):
-            self.logger.error(f"Program '{program_name}' not found")
-            return False
-
-        worker = self.processes[program_name]
-        return worker.restart()
+    def start_program(self, program_name: str) -> Tuple[bool, Optional[str], Dict[str, Any]]:
+        """Start a program, returning (success, failure reason, new status)."""
+        worker = self.processes.get(program_name)
+        if worker is None:
+            self.logger.error("Program '%s' not found", program_name)
+            return False, "not_found", {}
+
+        result = worker.start()
+        status = self.update_status(worker)
+        return (True, None, status) if result else (False, "failed", status)
+
+    def stop_program(self, program_name: str) -> Tuple[bool, Optional[str], Dict[str, Any]]:
+        """Stop a program, returning (success, failure reason, new status)."""
+        worker = self.processes.get(program_name)
+        if worker is None:
+            self.logger.error("Program '%s' not found", program_name)
+            return False, "not_found", {}
+
+        result = worker.stop()
+        status = self.update_status(worker)
+        return (True, None, status) if result else (False, "failed", status)
+
+    def restart_program(self, program_name: str) -> Tuple[bool, Optional[str], Dict[str, Any]]:
+        """Stop then restart a program, returning (success, failure reason, new status)."""
+        worker = self.processes.get(program_name)
+        if worker is None:
+            self.logger.error("Program '%s' not found", program_name)
+            return False, "not_found", {}
+
+        if not worker.stop():
+            return False, "stop_failed", self.update_status(worker)
+        result = worker.restart()
+        status = self.update_status(worker)
+        return (True, None, status) if result else (False, "failed", status)
+
+    def update_status(self, worker: ProcessWorker) -> Dict[str, Any]:
+        """Rebuild the cached status of a worker after a state change."""
+        worker.check_started()
+        status = worker.get_status()
+        with self.lock:
+            previous = self._status_cache.get(worker.name)
+            self._status_cache[worker.name] = status
+            changed = previous is None or previous['status'] != status['status']
+            # Uptime moves on every refresh; any other difference is a change.
+            if changed or any(previous[key] != value for key, value in status.items() if key != 'uptime'):
+                self.revision += 1
+        if changed:
+            self.monitor.wake()
+        return status
+
+    def _fresh_status(self, status: Dict[str, Any]) -> Dict[str, Any]:
+        # Uptime and the starting -> running transition only move while
+        # the process is alive; every other entry is served as cached.
+        if status['status'] in LIVE_STATES:
+            return self.update_status(self.processes[status['name']])
+        return status
 
     def get_program_status(self, program_name: str) -> Dict[str, Any]:
         """Get status of a specific program."""
-        if not self.program_exists(program_name):
+        status = self._status_cache.get(program_name)
+        if status is None:
             return {}
-
-        worker = self.processes[program_name]
-        return worker.get_status()
+        return self._fresh_status(status)
 
     def get_all_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all programs."""
-        return {name: worker.get_status() for name, worker in self.processes.items()}
+        with self.lock:
+            snapshot = dict(self._status_cache)
+        for name, status in snapshot.items():
+            snapshot[name] = self._fresh_status(status)
+        return snapshot
+
+    def status_json(self) -> bytes:
+        """Get the status of all programs as encoded JSON.
+
+        Entries are encoded without their uptime, once per revision; the
+        current uptimes are spliced in on every call.
+        """
+        self.get_all_status()
+        with self.lock:
+            cache = self._status_cache
+            if self._status_parts_revision != self.revision:
+                self._status_parts = [
+                    (name, json.dumps(name).encode() + b": "
+                     + json.dumps({key: value for key, value in status.items() if key != 'uptime'}).encode()[:-1]
+                     + b', "uptime": ')
+                    for name, status in cache.items()
+                ]
+                self._status_parts_revision = self.revision
+            return b"{" + b", ".join(
+                part + json.dumps(cache[name]['uptime']).encode() + b"}"
+                for name, part in self._status_parts
+            ) + b"}"
+
+    def _on_exit(self, worker: ProcessWorker, exit_code: int) -> None:
+        """Record a reaped child's exit and apply the worker's restart policy."""
+        worker.record_exit(exit_code)
+        self.update_status(worker)
+        if worker.should_autorestart():
+            delay = worker.restart_delay()
+            self.logger.info("Restarting process %s in %.1fs", worker.name, delay)
+            self.monitor.schedule_restart(worker, delay)
+
+    def _respawn(self, worker: ProcessWorker) -> None:
+        # A stop issued while the restart was queued wins.
+        if not worker.stop_byuser:
+            self._spawn(worker)
+
+    def _spawn(self, worker: ProcessWorker) -> None:
+        worker.start()
+        self.update_status(worker)
+
+    def _autostart(self, worker: ProcessWorker) -> None:
+        self.logger.info("Auto-starting program: %s", worker.name)
+        self._spawn(worker)
 
     def start_all_autostart(self):
         """Start all programs configured for autostart."""
-        for name, worker in self.processes.items():
-            if worker.config.get('autostart', False):
-                self.logger.info(f"Auto-starting program: {name}")
-                worker.start()
+        workers = [worker for worker in self.processes.values() if worker.config.get('autostart', False)]
+        # Spawns themselves are serialised by self.lock; the pool overlaps
+        # the user/group lookups and the notification round-trips.
+        for future in as_completed([self._spawn_pool.submit(self._autostart, worker) for worker in workers]):
+            future.result()
+
+    def shutdown(self):
+        """Release the monitor and spawn pool of a manager being replaced.
+
+        Children still running are left alone, but each gets a thread that
+        reaps it on exit so none is left behind as a zombie.
+        """
+        monitor = self.monitor
+        monitor.stop_monitoring()
+        if monitor.monitor_thread is not None:
+            monitor.monitor_thread.join(timeout=5)
+        self._spawn_pool.shutdown(wait=False, cancel_futures=True)
+        for worker in self.processes.values():
+            if worker.is_running():
+                threading.Thread(target=worker.process.wait, daemon=True).start()
 
     def stop_all(self):
         """Stop all running programs."""
         for worker in self.processes.values():
             if worker.is_running():
-                worker.stop()
\ No newline at end of file
+                worker.stop()
+                self.update_status(worker)
\ No newline at end of file
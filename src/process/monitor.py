@@ -1,47 +1,197 @@
 """Process monitoring module.
 
-This module handles process monitoring and health checks.
+This module handles process monitoring and health checks. Exits are
+collected from each child's pidfd; where pidfds are unavailable, a SIGCHLD
+self-pipe triggers a waitpid(-1, WNOHANG) sweep instead.
 """
-import logging ,threading,time
+import os, selectors, signal, logging ,threading, heapq, itertools, time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Bounds of the idle timeout; it grows while nothing changes and snaps
+# back to the minimum after any state change.
+_MIN_BACKOFF = 0.05
+_MAX_BACKOFF = 5.0
+
+# Wake-up pipes of the active monitors; written to from the SIGCHLD handler.
+_wakeup_fds = set()
+
+def _pidfd_supported() -> bool:
+    """pidfd_open needs Python 3.9 and Linux 5.3."""
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+        return True
+    except (AttributeError, OSError):
+        return False
+
+_PIDFD_SUPPORTED = _pidfd_supported()
+
+def _on_sigchld(signum, frame):
+    """Wake every monitor thread; reaping happens outside the handler."""
+    for fd in tuple(_wakeup_fds):
+        try:
+            os.write(fd, b'\0')
+        except OSError:
+            pass
 
 class ProcessMonitor:
     """Monitors process health and status."""
 
+    __slots__ = ("manager", "logger", "running", "monitor_thread",
+                 "_wake_r", "_wake_w", "_selector", "_backoff",
+                 "_restarts", "_restart_seq")
+
     def __init__(self, manager):
         self.manager = manager
         self.logger = logging.getLogger(__name__)
         self.running = False
         self.monitor_thread = None
-
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wake_r, selectors.EVENT_READ, ('wake',))
+        self._backoff = _MIN_BACKOFF
+        # Heap of (due, seq, worker); only touched from the monitor thread.
+        self._restarts = []
+        self._restart_seq = itertools.count()
 
     def start_monitoring(self):
         """Start the monitoring thread."""
+        if not _PIDFD_SUPPORTED:
+            _wakeup_fds.add(self._wake_w)
+            # Handlers can only be installed from the main thread; a monitor
+            # created later (e.g. on reload) reuses the one already in place.
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGCHLD, _on_sigchld)
         self.running = True
         self.monitor_thread = threading.Thread(target=self.monitor_loop)
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
+        # Children may have exited before the handler was installed.
+        self.wake()
 
-    def check_all(self):
-        for name, worker in self.manager.processes.items():
-            self.check_process(worker)
-
-    def check_process(self, worker):
-        if not worker.is_running():
-        
-            if self.should_restart(worker):
-                self.logger.info(f"Restarting process {worker.name}")
-                worker.start()
-            
-
-    def should_restart(self, worker):
-        if not worker.should_autorestart():
-            return False
-        return True
+    def stop_monitoring(self):
+        """Stop the monitoring thread."""
+        self.running = False
+        _wakeup_fds.discard(self._wake_w)
+        self.wake()
+
+    def wake(self):
+        """Make the monitoring thread run a check now."""
+        try:
+            os.write(self._wake_w, b'\0')
+        except OSError:
+            pass
+
+    def watch(self, worker):
+        """Register a freshly spawned worker's pidfd; it turns readable on exit."""
+        if not _PIDFD_SUPPORTED:
+            return
+        try:
+            pidfd = os.pidfd_open(worker.pid)
+        except OSError as e:
+            self.logger.error("Cannot watch process %s: %s", worker.name, e)
+            return
+        self._selector.register(pidfd, selectors.EVENT_READ, ('exit', worker, worker.pid))
+        worker.pidfd = pidfd
+
+    def _reap_pidfd(self, key):
+        pid = key.data[2]
+        try:
+            result = os.waitid(os.P_PIDFD, key.fd, os.WEXITED | os.WNOHANG)
+        except ChildProcessError:
+            # Already collected, e.g. by the worker's own wait() in stop().
+            result = None
+        except OSError:
+            # waitid(P_PIDFD) needs Linux 5.4; fall back to a plain reap.
+            result = None
+            self.reap_children()
+        else:
+            if result is None:
+                return
+        with self.manager.lock:
+            self._forget_pidfd(key)
+            if result is None:
+                return
+            worker = self.manager.pids.pop(pid, None)
+        if worker is not None:
+            exit_code = result.si_status if result.si_code == os.CLD_EXITED else -result.si_status
+            self.manager._on_exit(worker, exit_code)
+
+    def _forget_pidfd(self, key):
+        """Unregister and close a pidfd; the caller holds the manager lock."""
+        worker = key.data[1]
+        if worker.pidfd == key.fd:
+            worker.pidfd = None
+        self._selector.unregister(key.fd)
+        os.close(key.fd)
+
+    def schedule_restart(self, worker, delay: float):
+        """Queue an automatic restart; called from the reaping paths only."""
+        heapq.heappush(self._restarts, (time.monotonic() + delay, next(self._restart_seq), worker))
+
+    def _run_due_restarts(self) -> Optional[float]:
+        """Hand due restarts to the spawn pool; return seconds until the next one."""
+        restarts = self._restarts
+        now = time.monotonic()
+        while restarts and restarts[0][0] <= now:
+            worker = heapq.heappop(restarts)[2]
+            self.manager._spawn_pool.submit(self.manager._respawn, worker)
+        return restarts[0][0] - now if restarts else None
+
+    def reap_children(self):
+        """Collect every exited child and dispatch it to its worker."""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            with self.manager.lock:
+                worker = self.manager.pids.pop(pid, None)
+            if worker is not None:
+                self.manager._on_exit(worker, os.waitstatus_to_exitcode(status))
+
+    def check_starting(self) -> bool:
+        """Refresh workers still inside their startsecs window; True if any remain."""
+        pending = False
+        for worker in list(self.manager.processes.values()):
+            if worker.status == "starting":
+                self.manager.update_status(worker)
+                pending = pending or worker.status == "starting"
+        return pending
 
     def monitor_loop(self):
         """Main monitoring loop."""
-        while self.running:
-            self.check_all()
-            time.sleep(1)
\ No newline at end of file
+        timeout = self._backoff
+        while True:
+            revision = self.manager.revision
+            for key, _ in self._selector.select(timeout=timeout):
+                if key.data[0] == 'wake':
+                    os.read(self._wake_r, 4096)
+                elif self.running:
+                    self._reap_pidfd(key)
+            if not self.running:
+                break
+            if not _PIDFD_SUPPORTED:
+                # Also covers exits whose SIGCHLD was missed or never handled.
+                self.reap_children()
+            starting = self.check_starting()
+            if revision == self.manager.revision:
+                self._backoff = min(self._backoff * 1.5, _MAX_BACKOFF)
+            else:
+                self._backoff = _MIN_BACKOFF
+            # Exits arrive as pidfd readiness and state changes call wake(),
+            # so with nothing inside startsecs there is no reason to tick.
+            timeout = self._backoff if starting or not _PIDFD_SUPPORTED else None
+            next_restart = self._run_due_restarts()
+            if next_restart is not None and (timeout is None or next_restart < timeout):
+                timeout = next_restart
+        with self.manager.lock:
+            for key in list(self._selector.get_map().values()):
+                if key.data[0] == 'exit':
+                    self._forget_pidfd(key)
+        self._selector.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
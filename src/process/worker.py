@@ -9,13 +9,31 @@ import grp
 import signal
 import logging
 import subprocess
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import time
+import functools
+from typing import Dict, Any, Optional, List, Tuple, Union
+from datetime import datetime
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from notifications import SMTPNotifier
 
+# Statuses whose uptime and cached status entry go stale as time passes.
+LIVE_STATES = frozenset(("starting", "running"))
+# Statuses in which the child has been spawned and not yet collected.
+ALIVE_STATES = LIVE_STATES | {"stopping"}
+
+# Automatic restarts wait this long, doubled per retry, up to the cap.
+_RESTART_BACKOFF = 0.1
+_MAX_RESTART_DELAY = 5.0
+
+def _nice(increment: int) -> None:
+    """Lower the child's priority; runs between fork and exec, so never logs."""
+    try:
+        os.nice(increment)
+    except OSError:
+        pass
+
 class ProcessWorker:
     """Handles individual process lifecycle."""
 
@@ -27,12 +45,15 @@ class ProcessWorker:
         self.process: Optional[subprocess.Popen] = None
         self.start_time: Optional[datetime] = None
         self.stop_time: Optional[datetime] = None
+        self.start_monotonic: Optional[float] = None
         self.restart_count = 0
         self.status = "stopped"
         self.exit_code: Optional[int] = None
         self.pid: Optional[int] = None
+        self.pidfd: Optional[int] = None
         self.retry_count = 0
         self.stop_byuser = False
+        self._cache_config()
         self.smtp_notifier = SMTPNotifier(self.manager.get_smtp_config()) if self.manager.get_smtp_config() else None
 
 
@@ -52,7 +73,7 @@ class ProcessWorker:
         return self.config.get('exitcodes', [0])
     
     def get_startretries(self) -> int:
-        return self.config.get('startretries', 3)
+        return self.startretries
     
     def get_status_procces(self) -> str:
         """Get the current status of the process."""
@@ -69,7 +90,7 @@ class ProcessWorker:
                 is_success=False,
                 error_message=error_msg
             )
-            logging.error(f"Sending failure notification for process {self.name}: to {config.get('to', [])} with error: {error_msg}")
+            logging.error("Sending failure notification for process %s: to %s with error: %s", self.name, config.get('to', []), error_msg)
         elif event_type == 'success' and self.config.get('on_success', {}).get('smtp', {}).get('enabled'):
             config = self.config['on_success']['smtp']
             self.smtp_notifier.send_notification(self.name, action,
@@ -78,81 +99,75 @@ class ProcessWorker:
                 is_success=True,
                 error_message=error_msg
             )
-            logging.info(f"Sending success notification for process {self.name}: to {config.get('to', [])} with message: {error_msg}")
+            logging.info("Sending success notification for process %s: to %s with message: %s", self.name, config.get('to', []), error_msg)
 
     def start(self,restart=False) -> bool:
         self.stop_byuser = False
         if self.is_running():
-            self.logger.warning(f"Process {self.name} is already running")
+            self.logger.warning("Process %s is already running", self.name)
             return False
 
         try:
-            env = os.environ.copy()
-            env.update(self.config.get('env', {}))
-
-            uid = None
-            gid = None
             self.retry_count += 1
-            if 'user' in self.config:
-                try:
-                    pw = pwd.getpwnam(self.config['user'])
-                    uid = pw.pw_uid
-                    gid = pw.pw_gid
-                except KeyError:
-                    self.status = "fatal"
-                    self.logger.error(f"User {self.config['user']} not found")
-                    return False
-
-            if 'group' in self.config:
+            ids = self._resolve_ids()
+            if ids is None:
+                self.status = "fatal"
+                return False
+            uid, gid = ids
+
+            # Start the process; registered under the lock so the monitor
+            # cannot reap it before it is known. The umask is process-wide,
+            # so it is only swapped while holding the lock as well.
+            with self.manager.lock:
+                old_umask = os.umask(self.umask) if self.umask is not None else None
+                stdout = stderr = subprocess.DEVNULL
                 try:
-                    gr = grp.getgrnam(self.config['group'])
-                    gid = gr.gr_gid
-                    self.status = "fatal"
-                except KeyError:
-                    self.logger.error(f"Group {self.config['group']} not found")
-                    return False
-
-            # Set umask if specified
-            if 'umask' in self.config:
-                old_umask = os.umask(int(self.config['umask'], 8))
-
-            # Create stdout/stderr file handles
-            stdout = self._setup_log_file('stdout')
-            stderr = self._setup_log_file('stderr')
-
-            # Start the process
-            self.process = subprocess.Popen(
-                self.config['cmd'].split(),
-                stdout=stdout,
-                stderr=stderr,
-                env=env,
-                cwd=self.config.get('workingdir'),
-                preexec_fn=lambda: self._preexec(uid, gid)
-            )
-            self.status = "starting"
-            self.pid = self.process.pid
-            self.start_time = datetime.now()
-
-            self.logger.info(f"spawned  process {self.name} with PID {self.pid }")
+                    # Log files are rotated and reopened on every start; the
+                    # child keeps its own copies of the fds.
+                    stdout = self._setup_log_file('stdout')
+                    stderr = self._setup_log_file('stderr')
+
+                    self.process = subprocess.Popen(
+                        self.argv,
+                        stdout=stdout,
+                        stderr=stderr,
+                        env=self.env,
+                        cwd=self.config.get('workingdir'),
+                        # The credential switch happens in C inside the fork;
+                        # only the niceness is applied by a preexec_fn, so the
+                        # child runs at its priority from its first instruction.
+                        preexec_fn=self.preexec_fn,
+                        user=uid,
+                        group=gid
+                    )
+                finally:
+                    if old_umask is not None:
+                        os.umask(old_umask)
+                    self._close_log_fd(stdout)
+                    self._close_log_fd(stderr)
+                self.manager.pids[self.process.pid] = self
+                self.status = "starting"
+                self.pid = self.process.pid
+                self.start_time = datetime.now()
+                self.start_monotonic = time.monotonic()
+                self.manager.monitor.watch(self)
+
+            self.logger.info("spawned  process %s with PID %s", self.name, self.pid)
             if restart:
                 self.handle_notification('success', 'restart', None)
             else:
                 self.handle_notification('success', 'start', None)
             
-            if 'umask' in self.config:
-                os.umask(old_umask)
-            self.logger.info(f"process {self.name} started")
+            self.logger.info("process %s started", self.name)
             return True
 
         except Exception as e:
             self.status = "fatal"
-            self.logger.error(f"Error spawne process {self.name}: {e}")
+            self.logger.error("Error spawne process %s: %s", self.name, e)
             if restart:
                 self.handle_notification('failure', 'restart', str(e))
             else:
                 self.handle_notification('failure', 'start', str(e))
-            if 'umask' in self.config:
-                os.umask(old_umask)
             return False
 
       
@@ -164,27 +179,28 @@ class ProcessWorker:
             return True
 
         try:
-            self.logger.info(f"starting to stop process {self.name} with PID {self.pid}")
-            stop_signal = getattr(signal, f"SIG{self.config.get('stopsignal', 'TERM')}")
-            stop_time = self.config.get('stoptsecs', 10)
+            self.logger.info("starting to stop process %s with PID %s", self.name, self.pid)
+            stop_time = self.stopsecs
 
-            os.kill(self.pid, stop_signal)
+            self._send_signal(self.stop_signal)
             self.status = "stopping"
 
             self.handle_notification('success', 'stop', None)
             # Wait for process to stop
             try:
-                logging.info(f"Waiting for process {self.name} to stop")
+                logging.info("Waiting for process %s to stop", self.name)
                 self.process.wait(timeout=stop_time)
+                self._forget_pid()
                 self.status = "stopped"
                 self.stop_time = datetime.now()
                 return True
             except subprocess.TimeoutExpired:
                 # Force kill if timeout
-                logging.warning(f"Process {self.name} did not stop in time, force killing")
+                logging.warning("Process %s did not stop in time, force killing", self.name)
                 self.handle_notification('failure', 'stop', f"Process {self.name} did not stop in time, force killing")
-                os.kill(self.pid, signal.SIGKILL)
+                self._send_signal(signal.SIGKILL)
                 self.process.wait()
+                self._forget_pid()
                 self.status = "stopped"
                 self.stop_time = datetime.now()
                 return True
@@ -196,40 +212,52 @@ class ProcessWorker:
             return True
         except Exception as e:
             self.handle_notification('failure', 'stop', str(e))
-            self.logger.error(f"Error stopping process {self.name}: {e}")
+            self.logger.error("Error stopping process %s: %s", self.name, e)
             self.status = "fatal"
             return False
 
+    def _send_signal(self, sig: int) -> None:
+        """Signal the child through its pidfd, which cannot hit a recycled pid."""
+        # The monitor closes the pidfd under the lock once the child is reaped.
+        with self.manager.lock:
+            if self.pidfd is not None:
+                signal.pidfd_send_signal(self.pidfd, sig)
+                return
+        os.kill(self.pid, sig)
+
+    def _forget_pid(self) -> None:
+        """Drop the pid from the manager once it has been waited for here."""
+        with self.manager.lock:
+            if self.manager.pids.get(self.pid) is self:
+                del self.manager.pids[self.pid]
+
     def restart(self) -> bool:
-        logging.info(f"Restarting process {self.name}")
+        logging.info("Restarting process %s", self.name)
         success = self.start('restart')
         if success:
             self.restart_count += 1
         return success
 
     def is_running(self) -> bool:
-        if self.process is None or self.pid is None:
-            return False
-        try:
-            start_duration = (datetime.now() - self.start_time).total_seconds()
-            if self.process.poll() is not None:
-                # Process has finished, collect exit status
-                self.exit_code = self.process.returncode
-                if self.status != "fatal" and start_duration < self.config.get('startsecs', 1):
-                    self.status = "fatal"
-                if self.status != "fatal":
-                    self.status = "exited" 
-                self.stop_time = datetime.now()
-                return False
+        # Exits are recorded through record_exit(), so the status is current.
+        return self.process is not None and self.status in ALIVE_STATES
 
-            if self.status == "starting" and self.start_time:
-                if start_duration >= self.config.get('startsecs', 1):
-                    self.status = "running"
-            return True
-        except OSError:
-            if self.status != "exited" or self.status != "fatal":
-                self.status = "stopped"
-            return False
+    def record_exit(self, exit_code: int) -> None:
+        """Record an exit collected by the monitor's reaper."""
+        if self.process is not None:
+            # Keep the Popen object consistent for anything inspecting it.
+            self.process.returncode = exit_code
+        self.exit_code = exit_code
+        if self.status != "fatal" and time.monotonic() - self.start_monotonic < self.startsecs:
+            self.status = "fatal"
+        if self.status != "fatal":
+            self.status = "exited"
+        self.stop_time = datetime.now()
+
+    def check_started(self) -> None:
+        """Promote a starting process to running once it has lasted startsecs."""
+        if self.status == "starting" and time.monotonic() - self.start_monotonic >= self.startsecs:
+            self.status = "running"
 
     def get_status(self) -> Dict[str, Any]:
         """Get current process status."""
@@ -241,53 +269,88 @@ class ProcessWorker:
             "restarts": self.restart_count,
             "exitcode": self.exit_code,
             "cmd": self.config['cmd'],
-            "config": {
-                "numprocs": self.config.get('numprocs', 1),
-                "autostart": self.config.get('autostart', False),
-                "autorestart": self.config.get('autorestart', 'unexpected'),
-                "startsecs": self.config.get('startsecs', 1),
-                "stopsignal": self.config.get('stopsignal', 'TERM'),
-                "stoptsecs": self.config.get('stoptsecs', 10),
-                "exitcodes": self.config.get('exitcodes', [0]),
-                "startretries": self.config.get('startretries', 3),
-                "user": self.config.get('user'),
-                "group": self.config.get('group'),
-                "workingdir": self.config.get('workingdir','/tmp'),
-                "env": self.config.get('env', {}),
-                "umask": self.config.get('umask', '022'),
-                "priority": self.config.get('priority', None),
-            }
+            "config": self.status_config
         }
         return status
 
     def update_config(self, new_config: Dict[str, Any]):
         """Update process configuration."""
         self.config = new_config
-
-    def _preexec(self, uid: Optional[int], gid: Optional[int]):
-        """Handle pre-execution setup."""
-        # Set priority if specified
+        self._cache_config()
+
+    def _cache_config(self):
+        """Resolve the settings read on every exit once per configuration."""
+        self.autorestart = self.config.get('autorestart', 'unexpected')
+        self.exitcodes = frozenset(int(code) for code in self.config.get('exitcodes', [0]))
+        self.startretries = self.config.get('startretries', 3)
+        self.startsecs = self.config.get('startsecs', 1)
+        self.stopsecs = self.config.get('stoptsecs', 10)
+        # The validator restricts stopsignal to names the signal module knows.
+        self.stop_signal = getattr(signal, f"SIG{self.config.get('stopsignal', 'TERM')}")
+        self.argv = self.config['cmd'].split()
+        # The supervisor's own environment is fixed once it is running.
+        self.env = {**os.environ, **self.config.get('env', {})}
+        self.umask = int(self.config['umask'], 8) if 'umask' in self.config else None
+        # Shared by every status snapshot; only replaced on a config change.
+        self.status_config = {
+            "numprocs": self.config.get('numprocs', 1),
+            "autostart": self.config.get('autostart', False),
+            "autorestart": self.autorestart,
+            "startsecs": self.startsecs,
+            "stopsignal": self.config.get('stopsignal', 'TERM'),
+            "stoptsecs": self.stopsecs,
+            "exitcodes": self.config.get('exitcodes', [0]),
+            "startretries": self.startretries,
+            "user": self.config.get('user'),
+            "group": self.config.get('group'),
+            "workingdir": self.config.get('workingdir','/tmp'),
+            "env": self.config.get('env', {}),
+            "umask": self.config.get('umask', '022'),
+            "priority": self.config.get('priority', None),
+        }
+        self.policy = self._build_policy()
         priority = self.config.get('priority')
-        if priority is not None:
-            try:
-                os.nice(priority)
-            except OSError as e:
-                self.logger.warning(f"Failed to set priority: {e}")
-
-        # Set user and group if specified
-        if gid is not None:
+        self.preexec_fn = functools.partial(_nice, priority) if priority is not None else None
+        # Unresolved until the next spawn; False once a lookup has failed.
+        self._ids: Union[Tuple[Optional[int], Optional[int]], bool, None] = None
+
+    def _resolve_ids(self) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """Look up the configured user/group once per configuration; None if unknown."""
+        ids = self._ids
+        if ids is None:
+            # A failed lookup is cached as False, so it is neither retried
+            # nor logged again until the configuration changes.
+            ids = self._ids = self._lookup_ids() or False
+        return ids or None
+
+    def _lookup_ids(self) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        uid = None
+        gid = None
+        if 'user' in self.config:
             try:
-                os.setgid(gid)
-            except OSError as e:
-                self.logger.error(f"Failed to set group: {e}")
-                sys.exit(1)
-
-        if uid is not None:
+                pw = pwd.getpwnam(self.config['user'])
+                uid = pw.pw_uid
+                gid = pw.pw_gid
+            except KeyError:
+                self.logger.error("User %s not found", self.config['user'])
+                return None
+
+        if 'group' in self.config:
             try:
-                os.setuid(uid)
-            except OSError as e:
-                self.logger.error(f"Failed to set user: {e}")
-                sys.exit(1)
+                gid = grp.getgrnam(self.config['group']).gr_gid
+            except KeyError:
+                self.logger.error("Group %s not found", self.config['group'])
+                return None
+        return uid, gid
+
+    def _build_policy(self):
+        """Resolve the autorestart branches into one (exit_code, retry_count, fatal) check."""
+        if self.autorestart == 'always':
+            return lambda ec, rc, fatal, _retries=self.startretries: rc < 5 or (fatal and rc - 1 < _retries)
+        if self.autorestart == 'unexpected':
+            return lambda ec, rc, fatal, _retries=self.startretries, _codes=self.exitcodes: \
+                rc - 1 < _retries and (fatal or ec not in _codes)
+        return lambda ec, rc, fatal, _retries=self.startretries: fatal and rc - 1 < _retries
 
     def _rename_log_file(self, old_name: str) -> str:
         """Rename log file if it already exists."""
@@ -295,41 +358,48 @@ class ProcessWorker:
             return old_name
         base, ext = os.path.splitext(old_name)
         new_name = f"{base}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
-        self.logger.warning(f"Log file {old_name} already exists, renaming to {new_name}")
+        self.logger.warning("Log file %s already exists, renaming to %s", old_name, new_name)
         os.rename(old_name, new_name)
         return new_name
 
-    def _setup_log_file(self, stream: str) -> Optional[int]:
+    def _close_log_fd(self, fd: int) -> None:
+        # DEVNULL is a negative marker, not an fd of ours.
+        if fd >= 0:
+            os.close(fd)
+
+    def _open_log_file(self, path: str) -> int:
+        return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o666)
+
+    def _setup_log_file(self, stream: str) -> int:
         config = self.config.get(stream)
         if not config:
             return subprocess.DEVNULL
         if isinstance(config, str):
             if os.path.exists(os.path.dirname(config)):
                 new_name = self._rename_log_file(config)
-                return open(new_name, 'a')
+                return self._open_log_file(new_name)
             else:   
-                return open(config, 'a')
+                return self._open_log_file(config)
         elif isinstance(config, dict):
             if 'path' in config and os.path.exists(os.path.dirname(config['path'])):
                 new_name = self._rename_log_file(config['path'])
-                return open(new_name, 'a')
+                return self._open_log_file(new_name)
             elif 'path' in config:
-                return open(config['path'], 'a')
+                return self._open_log_file(config['path'])
             else:
-                self.logger.error(f"Invalid log configuration for {stream}: {config}")
+                self.logger.error("Invalid log configuration for %s: %s", stream, config)
                 return subprocess.DEVNULL
         
         return subprocess.DEVNULL
 
     def _get_uptime(self) -> str:
         """Get process uptime as string."""
-        if not self.start_time or not self.is_running():
+        # Exits are recorded by the monitor, so the status alone is current.
+        if self.start_monotonic is None or self.status not in LIVE_STATES:
             return "0s"
 
-        uptime = datetime.now() - self.start_time
-        hours = uptime.seconds // 3600
-        minutes = (uptime.seconds % 3600) // 60
-        seconds = uptime.seconds % 60
+        hours, rest = divmod(int(time.monotonic() - self.start_monotonic), 3600)
+        minutes, seconds = divmod(rest, 60)
 
         if hours > 0:
             return f"{hours}h {minutes}m"
@@ -338,17 +408,11 @@ class ProcessWorker:
         else:
             return f"{seconds}s"
         
+    def restart_delay(self) -> float:
+        """Seconds to wait before the next automatic restart."""
+        return min(_RESTART_BACKOFF * 2 ** max(self.retry_count - 1, 0), _MAX_RESTART_DELAY)
+
     def should_autorestart(self) -> bool:
         if self.stop_byuser:
             return False
-        autorestart = self.config.get('autorestart', 'unexpected')
-        exitcodes = self.config.get('exitcodes', [0])
-        
-        if autorestart == 'always' and self.retry_count < 5:
-            return True
-        elif autorestart == 'unexpected' and self.exit_code not in exitcodes and self.retry_count - 1 < self.get_startretries():
-            return True
-        elif self.retry_count - 1 < self.get_startretries() and self.status == "fatal":
-            return True
-        
-        return False
\ No newline at end of file
+        return self.policy(self.exit_code, self.retry_count, self.status == "fatal")
\ No newline at end of file
@@ -1,45 +1,54 @@
-class NotificationTemplates:
-    @staticmethod
-    def success_template(program_name: str, action: str) -> dict:
-        """Template for successful operations"""
-        return {
-            'subject': f"✅ {program_name} - {action.capitalize()} Successful",
-            'body': f"""
+from string import Template
+
+# Message bodies, compiled once; filled in a single substitution pass
+_SUCCESS_BODY = Template("""
 Hello,
 
 The operation has completed successfully:
 
-Program: {program_name}
-Action: {action.capitalize()}
+Program: $program
+Action: $title
 Status: SUCCESS
-Time: {{timestamp}}
+Time: $timestamp
 
-The {program_name} service has been {action}ed successfully.
+The $program service has been ${action}ed successfully.
 
 Best regards,
 TaskMaster System
-"""
-        }
-    
-    @staticmethod
-    def failure_template(program_name: str, action: str, error_message: str) -> dict:
-        """Template for failed operations"""
-        return {
-            'subject': f"❌ {program_name} - {action.capitalize()} Failed",
-            'body': f"""
+""")
+
+_FAILURE_BODY = Template("""
 Hello,
 
 An error occurred during the operation:
 
-Program: {program_name}
-Action: {action.capitalize()}
+Program: $program
+Action: $title
 Status: FAILED
-Error: {error_message}
-Time: {{timestamp}}
+Error: $error
+Time: $timestamp
 
 Please check the system logs for more details.
 
 Best regards,
 TaskMaster System
-"""
-        }
\ No newline at end of file
+""")
+
+class NotificationTemplates:
+    @staticmethod
+    def success_template(program_name: str, action: str, timestamp: str) -> dict:
+        """Template for successful operations"""
+        title = action.capitalize()
+        return {
+            'subject': f"✅ {program_name} - {title} Successful",
+            'body': _SUCCESS_BODY.substitute(program=program_name, action=action, title=title, timestamp=timestamp)
+        }
+
+    @staticmethod
+    def failure_template(program_name: str, action: str, error_message: str, timestamp: str) -> dict:
+        """Template for failed operations"""
+        title = action.capitalize()
+        return {
+            'subject': f"❌ {program_name} - {title} Failed",
+            'body': _FAILURE_BODY.substitute(program=program_name, title=title, error=error_message, timestamp=timestamp)
+        }
@@ -1,102 +1,117 @@
 """UI display templates for the Taskmaster interface"""
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Sequence, Tuple
 import urwid
 
+# Dividers hold no state, so every view shares the same two instances
+BLANK_DIVIDER = urwid.Divider()
+DASH_DIVIDER = urwid.Divider('-')
+
+# Constant labels of the program details view, shared the same way
+DETAILS_TITLE = urwid.Text(('title', "Program Details"))
+BASIC_INFO_HEADER = urwid.Text(('header', "Basic Information:"))
+PROCESS_CONTROL_HEADER = urwid.Text(('header', "Process Control:"))
+STDOUT_HEADER = urwid.Text(('header', "Stdout Configuration:"))
+ENV_HEADER = urwid.Text(('header', "Environment Variables:"))
+NOTIFICATIONS_HEADER = urwid.Text(('header', "Notifications:"))
+ON_FAILURE_LABEL = urwid.Text(('warning', "On Failure:"))
+ON_SUCCESS_LABEL = urwid.Text(('success', "On Success:"))
+DETAILS_NAVIGATION = urwid.Text(('info', "Press 'status' to return to the main view"))
+
+# Column layout of a status overview row, compiled once
+_ROW_FMT = "{:<15} {:<10} {:<8} {:<10} {:<8} {:<40}".format
+
+# Constant head of the status overview
+STATUS_TITLE = urwid.Text(('title', "Program Status Overview"))
+STATUS_HEADER = urwid.Text(('header', _ROW_FMT('Name', 'Status', 'PID', 'Uptime', 'Restarts', 'CMD')))
+
+_STATUS_COLORS = {
+    'running': 'success',
+    'stopped': 'warning',
+    'fatal': 'error',
+    'starting': 'info'
+}
+
 class UITemplates:
     @staticmethod
-    def create_program_section(title: str, programs: List[str], color: str = 'normal') -> List[urwid.Widget]:
-        """Create a section of program names with a title"""
+    def create_program_section(title: str, programs: Sequence[str], color: str = 'normal',
+                               *, presorted: bool = False) -> List[urwid.Widget]:
+        """Create a section of program names with a title; pass presorted=True
+        when the names are already in order to skip the sort"""
         if not programs:
             return []
-        
-        widgets = [
-            urwid.Text((color, f"  {title}:")),
-        ]
-        for name in sorted(programs):
-            widgets.append(urwid.Text(f"    {name}"))
-        return widgets
+
+        if not presorted:
+            programs = sorted(programs)
+        Text = urwid.Text
+        return [Text((color, f"  {title}:"))] + [Text(f"    {name}") for name in programs]
 
     @staticmethod
     def create_program_details_view(data: Dict[str, Any], program_name: str) -> List[urwid.Widget]:
         """Create the program details view"""
-        basic_info = [
-            urwid.Text(('title', "Program Details")),
-            urwid.Divider(),
-            urwid.Text(('header', "Basic Information:")),
-            urwid.Text(f"Command: {data[program_name].get('cmd', 'N/A')}"),
-            urwid.Text(f"Status: {data[program_name].get('status', 'N/A')}"),
-            urwid.Text(f"PID: {data[program_name].get('pid', 'N/A')}"),
-            urwid.Text(f"Uptime: {data[program_name].get('uptime', 'N/A')} seconds"),
-            urwid.Text(f"Restarts: {data[program_name].get('restarts', 'N/A')}"),
-            urwid.Text(f"Number of Processes: {data[program_name]['config'].get('numprocs', 'N/A')}"),
-            urwid.Text(f"Umask: {data[program_name]['config'].get('umask', 'N/A')}"),
-            urwid.Text(f"User: {data[program_name]['config'].get('user', 'N/A')}"),
-            urwid.Text(f"Group: {data[program_name]['config'].get('group', 'N/A')}"),
-            urwid.Text(f"Priority: {data[program_name]['config'].get('priority', 'N/A')}"),
-            urwid.Text(f"Working Directory: {data[program_name]['config'].get('workingdir', 'N/A')}"),
-            urwid.Divider()
-        ]
-
-        process_control = [
-            urwid.Text(('header', "Process Control:")),
-            urwid.Text(f"Autostart: {data[program_name]['config'].get('autostart', 'N/A')}"),
-            urwid.Text(f"Autorestart: {data[program_name]['config'].get('autorestart', 'N/A')}"),
-            urwid.Text(f"Exit Codes: {data[program_name]['config'].get('exitcodes', 'N/A')}"),
-            urwid.Text(f"Start Retries: {data[program_name]['config'].get('startretries', 'N/A')}"),
-            urwid.Text(f"Start Time: {data[program_name]['config'].get('startsecs', 'N/A')} seconds"),
-            urwid.Text(f"Stop Signal: {data[program_name]['config'].get('stopsignal', 'N/A')}"),
-            urwid.Text(f"Stop Time: {data[program_name]['config'].get('stoptsecs', 'N/A')} seconds"),
-            urwid.Divider()
+        program = data[program_name]
+        pget, cget = program.get, program.get('config', {}).get
+        Text = urwid.Text
+        # Basic information and process control, built straight into the result
+        widgets = [
+            DETAILS_TITLE,
+            BLANK_DIVIDER,
+            BASIC_INFO_HEADER,
+            Text(f"Command: {pget('cmd', 'N/A')}"),
+            Text(f"Status: {pget('status', 'N/A')}"),
+            Text(f"PID: {pget('pid', 'N/A')}"),
+            Text(f"Uptime: {pget('uptime', 'N/A')} seconds"),
+            Text(f"Restarts: {pget('restarts', 'N/A')}"),
+            Text(f"Number of Processes: {cget('numprocs', 'N/A')}"),
+            Text(f"Umask: {cget('umask', 'N/A')}"),
+            Text(f"User: {cget('user', 'N/A')}"),
+            Text(f"Group: {cget('group', 'N/A')}"),
+            Text(f"Priority: {cget('priority', 'N/A')}"),
+            Text(f"Working Directory: {cget('workingdir', 'N/A')}"),
+            BLANK_DIVIDER,
+            PROCESS_CONTROL_HEADER,
+            Text(f"Autostart: {cget('autostart', 'N/A')}"),
+            Text(f"Autorestart: {cget('autorestart', 'N/A')}"),
+            Text(f"Exit Codes: {cget('exitcodes', 'N/A')}"),
+            Text(f"Start Retries: {cget('startretries', 'N/A')}"),
+            Text(f"Start Time: {cget('startsecs', 'N/A')} seconds"),
+            Text(f"Stop Signal: {cget('stopsignal', 'N/A')}"),
+            Text(f"Stop Time: {cget('stoptsecs', 'N/A')} seconds"),
+            BLANK_DIVIDER
         ]
 
-        logging_info = []
+        # Logging
         stdout = data.get('stdout', {})
         if isinstance(stdout, dict):
-            logging_info.extend([
-                urwid.Text(('header', "Stdout Configuration:")),
-                urwid.Text(f"  Path: {stdout.get('path', 'N/A')}"),
-                urwid.Text(f"  Max Bytes: {stdout.get('maxbytes', 'N/A')}"),
-                urwid.Divider()
-            ])
+            widgets.extend((
+                STDOUT_HEADER,
+                Text(f"  Path: {stdout.get('path', 'N/A')}"),
+                Text(f"  Max Bytes: {stdout.get('maxbytes', 'N/A')}"),
+            ))
         else:
-            logging_info.extend([
-                urwid.Text(f"Stdout: {stdout}"),
-                urwid.Divider()
-            ])
+            widgets.append(Text(f"Stdout: {stdout}"))
+        widgets.append(BLANK_DIVIDER)
 
         # Navigation footer
-        navigation = [
-            urwid.Text(('info', "Press 'status' to return to the main view"))
-        ]
-
-        return basic_info + process_control + logging_info + navigation
+        widgets.append(DETAILS_NAVIGATION)
+        return widgets
 
     @staticmethod
     def create_status_view(programs: Dict[str, Any]) -> List[urwid.Widget]:
         """Create the status overview view"""
-        header = [
-            urwid.Text(('title', "Program Status Overview")),
-            urwid.Divider(),
-            urwid.Text(('header', f"{'Name':<15} {'Status':<10} {'PID':<8} {'Uptime':<10} {'Restarts':<8} {'CMD':<40}")),
-            urwid.Divider('-')
-        ]
+        header = [STATUS_TITLE, BLANK_DIVIDER, STATUS_HEADER, DASH_DIVIDER]
 
-        program_lines = []
-        for name, info in programs.items():
-            status_color = UITemplates.get_status_color(info['status'])
-            line = f"{name:<15} {info['status']:<10} {str(info['pid'] or '-'):<8} {info['uptime']:<10} {info['restarts']:<8} {info['cmd']:<40}"
-            program_lines.append(urwid.Text((status_color, line)))
+        program_lines = [urwid.Text(UITemplates.create_status_row(name, info)) for name, info in programs.items()]
 
-        return header + program_lines + [urwid.Divider()]
+        return header + program_lines + [BLANK_DIVIDER]
+
+    @staticmethod
+    def create_status_row(name: str, info: Dict[str, Any], _color=_STATUS_COLORS.get) -> Tuple[str, str]:
+        """Create the (color, line) markup of one status overview row"""
+        status = info['status']
+        return _color(status, 'normal'), _ROW_FMT(name, status, str(info['pid'] or '-'), info['uptime'], info['restarts'], info['cmd'])
 
     @staticmethod
-    def get_status_color(status: str) -> str:
+    def get_status_color(status: str, _color=_STATUS_COLORS.get) -> str:
         """Get the color for a program status"""
-        colors = {
-            'running': 'success',
-            'stopped': 'warning',
-            'fatal': 'error',
-            'starting': 'info'
-        }
-        return colors.get(status, 'normal')
+        return _color(status, 'normal')
@@ -0,0 +1,76 @@
+"""Reuse of TaskmasterClient's kept socket connection."""
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'core'))
+
+try:
+    from Taskmasterctl import TaskmasterClient
+except ImportError:  # requests is only needed by the HTTP transport
+    TaskmasterClient = None
+
+
+class _LineServer:
+    """Replies to every newline-terminated command with a JSON line."""
+
+    def __init__(self):
+        self.sock = socket.create_server(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self.connections = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        with conn, conn.makefile('rb') as reader:
+            for _ in reader:
+                conn.sendall(b'{"status": "success"}\n')
+
+    def close(self):
+        self.sock.close()
+        for conn in self.connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+@unittest.skipIf(TaskmasterClient is None, "Taskmasterctl not importable")
+class ClientConnectionReuseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _LineServer()
+        self.client = TaskmasterClient('socket', self.server.port, '127.0.0.1')
+
+    def tearDown(self):
+        self.client._disconnect()
+        self.server.close()
+
+    def test_idle_connection_is_reused_without_waiting(self):
+        for _ in range(3):
+            started = time.monotonic()
+            self.assertEqual(self.client.send_command('status'), {'status': 'success'})
+            self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_connection_closed_by_server_is_reopened(self):
+        self.client.send_command('status')
+        self.server.connections[0].shutdown(socket.SHUT_RDWR)
+        time.sleep(0.05)
+        self.assertEqual(self.client.send_command('status'), {'status': 'success'})
+        self.assertEqual(len(self.server.connections), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Log file handling of ProcessWorker across restarts."""
+import glob
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from process.worker import ProcessWorker
+
+
+class _Monitor:
+    def watch(self, worker):
+        pass
+
+
+class _Manager:
+    """The parts of ProcessManager a worker touches while spawning."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pids = {}
+        self.monitor = _Monitor()
+
+    def get_smtp_config(self):
+        return None
+
+
+class WorkerLogRestartTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.tmpdir.name, 'echo.log')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _run(self, worker):
+        self.assertTrue(worker.start())
+        worker.record_exit(worker.process.wait())
+
+    def _rotated(self):
+        return glob.glob(os.path.join(self.tmpdir.name, 'echo_*.log'))
+
+    def test_log_is_rotated_on_every_start(self):
+        worker = ProcessWorker('echo', {'cmd': 'echo hello', 'startsecs': 0,
+                                        'stdout': self.log_path}, _Manager())
+        self._run(worker)
+        self.assertTrue(os.path.exists(self.log_path))
+        self.assertEqual(self._rotated(), [])
+
+        self._run(worker)
+        self.assertFalse(os.path.exists(self.log_path))
+        rotated = self._rotated()
+        self.assertEqual(len(rotated), 1)
+        with open(rotated[0]) as f:
+            self.assertEqual(f.read(), 'hello\nhello\n')
+
+        self._run(worker)
+        with open(self.log_path) as f:
+            self.assertEqual(f.read(), 'hello\n')
+
+    def test_log_fds_are_not_kept_by_the_supervisor(self):
+        worker = ProcessWorker('echo', {'cmd': 'echo hello', 'startsecs': 0,
+                                        'stdout': {'path': self.log_path},
+                                        'stderr': {'path': self.log_path + '.err'}}, _Manager())
+        before = len(os.listdir('/proc/self/fd'))
+        self._run(worker)
+        self._run(worker)
+        self.assertEqual(len(os.listdir('/proc/self/fd')), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
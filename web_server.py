@@ -9,9 +9,13 @@ import sys
 import json
 import logging
 import argparse
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from urllib.parse import parse_qs, urlparse
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 
 # Add parent directory to sys.path to import Taskmaster modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -19,6 +23,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.config.manager import ConfigManager
 from src.core.Taskmasterctl import TaskmasterClient
 
+# orjson is optional; it encodes straight to bytes and much faster
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +38,120 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Dashboard files served by default
+WEB_ROOT = os.path.join(os.path.dirname(__file__), 'web')
+
+# Browsers may reuse static files this long before revalidating them
+STATIC_CACHE_CONTROL = 'public, max-age=300'
+
+# MIME types of the dashboard's static files, by extension
+_MIME_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.ico': 'image/x-icon',
+    '.svg': 'image/svg+xml',
+    '.json': 'application/json',
+}
+
+# URL path -> file path of every file under a web root, by root
+_STATIC_INDEXES = {}
+_STATIC_INDEXES_LOCK = threading.Lock()
+
+def static_index(web_root):
+    """Map the URL path of each file under web_root to its absolute path; the
+    tree is walked once, so files added later are not served until restart"""
+    with _STATIC_INDEXES_LOCK:
+        index = _STATIC_INDEXES.get(web_root)
+        if index is None:
+            index = _STATIC_INDEXES[web_root] = {}
+            root_abs = os.path.abspath(web_root)
+            for root, _, files in os.walk(root_abs):
+                for name in files:
+                    full = os.path.join(root, name)
+                    index['/' + os.path.relpath(full, root_abs).replace(os.sep, '/')] = full
+        return index
+
+# Recently served static files: path -> (mtime_ns, size, bytes), oldest first
+_STATIC_CACHE = OrderedDict()
+_STATIC_CACHE_LOCK = threading.Lock()
+_STATIC_CACHE_ENTRIES = 64
+_STATIC_CACHE_MAX_FILE = 1 << 20
+
+def read_static(file_path, st):
+    """Get a static file's contents, from memory while its mtime and size still match"""
+    key = (st.st_mtime_ns, st.st_size)
+    with _STATIC_CACHE_LOCK:
+        entry = _STATIC_CACHE.get(file_path)
+        if entry is not None and entry[:2] == key:
+            _STATIC_CACHE.move_to_end(file_path)
+            return entry[2]
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if len(data) <= _STATIC_CACHE_MAX_FILE:
+        with _STATIC_CACHE_LOCK:
+            _STATIC_CACHE[file_path] = key + (data,)
+            _STATIC_CACHE.move_to_end(file_path)
+            if len(_STATIC_CACHE) > _STATIC_CACHE_ENTRIES:
+                _STATIC_CACHE.popitem(last=False)
+    return data
+
+# Commands the daemon understands (see process_command in taskmasterd);
+# anything else is rejected here without a round trip
+_DAEMON_COMMANDS = frozenset(('alive', 'status', 'detail', 'start', 'stop', 'restart', 'reload'))
+
+# Replies to read-only commands, shared by dashboards polling together:
+# response_key() -> (monotonic time, encoded reply), oldest first
+_CACHEABLE_COMMANDS = frozenset(('status', 'detail', 'alive'))
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_ENTRIES = 64
+_RESPONSE_TTL = 0.5
+# Bumped by every clear; a reply fetched under an older generation may
+# predate a state change and is not stored
+_response_generation = 0
+
+def response_key(cmd_parts):
+    """Cache key of a read-only command; the daemon only reads the program
+    name of 'detail' and ignores any other argument"""
+    if cmd_parts[0] == 'detail':
+        return tuple(cmd_parts[:2])
+    return (cmd_parts[0],)
+
+def cached_response(key):
+    """Get the encoded reply to a read-only command if it is fresh enough,
+    along with the cache generation to hand back to store_response"""
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] < _RESPONSE_TTL:
+                return entry[1], _response_generation
+            del _RESPONSE_CACHE[key]
+        return None, _response_generation
+
+def store_response(key, body, generation):
+    """Remember a read-only command's reply unless the cache was cleared
+    since the reply was asked for"""
+    with _RESPONSE_CACHE_LOCK:
+        if generation != _response_generation:
+            return
+        _RESPONSE_CACHE[key] = (time.monotonic(), body)
+        _RESPONSE_CACHE.move_to_end(key)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_ENTRIES:
+            _RESPONSE_CACHE.popitem(last=False)
+
+def clear_responses():
+    """Drop every remembered reply; any command other than a read-only one
+    may change program state"""
+    global _response_generation
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+        _response_generation += 1
+
 class TaskmasterWebHandler(SimpleHTTPRequestHandler):
     """
     HTTP request handler for Taskmaster web interface
@@ -34,7 +159,8 @@ class TaskmasterWebHandler(SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         self.config = kwargs.pop('config', None)
         self.client = kwargs.pop('client', None)
-        self.web_root = kwargs.pop('web_root', os.path.join(os.path.dirname(__file__), 'web'))
+        self.web_root = kwargs.pop('web_root', WEB_ROOT)
+        self.static_index = static_index(self.web_root)
         super().__init__(*args, **kwargs)
 
     def log_message(self, format, *args):
@@ -55,13 +181,15 @@ class TaskmasterWebHandler(SimpleHTTPRequestHandler):
         # Serve the taskmaster log directly
         if path == '/logs':
             try:
-
                 with open('/tmp/taskmasterd.log', 'rb') as f:
-                    log_data = f.read()
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/plain; charset=utf-8')
-                self.end_headers()
-                self.wfile.write(log_data)
+                    # The log keeps growing; send the size it has right now
+                    size = os.fstat(f.fileno()).st_size
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/plain; charset=utf-8')
+                    self.send_header('Content-Length', str(size))
+                    self.end_headers()
+                    # Copied in the kernel via sendfile(2) where available
+                    self.connection.sendfile(f, 0, size)
             except FileNotFoundError:
                 self.send_error(404, 'Log file not found')
             except Exception as e:
@@ -72,18 +200,33 @@ class TaskmasterWebHandler(SimpleHTTPRequestHandler):
         if path == '/':
             path = '/index.html'  # Default to index.html
 
-        # Serve files from web directory
-        file_path = os.path.join(self.web_root, path.lstrip('/'))
+        # Serve files from web directory; only files indexed at startup exist,
+        # so no request path can reach outside of it
+        file_path = self.static_index.get(path)
+        if file_path is None:
+            self.send_error(404, 'File not found')
+            return
         
         # Set MIME types for specific file extensions
         content_type = self.guess_type(file_path)
 
         try:
-            with open(file_path, 'rb') as f:
-                self.send_response(200)
-                self.send_header('Content-type', content_type)
+            st = os.stat(file_path)
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            if self.not_modified(etag, st.st_mtime):
+                self.send_response(304)
+                self.send_header('ETag', etag)
                 self.end_headers()
-                self.wfile.write(f.read())
+                return
+            body = read_static(file_path, st)
+            self.send_response(200)
+            self.send_header('Content-type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', formatdate(st.st_mtime, usegmt=True))
+            self.send_header('Cache-Control', STATIC_CACHE_CONTROL)
+            self.end_headers()
+            self.wfile.write(body)
         except FileNotFoundError:
             self.send_error(404, 'File not found')
         except PermissionError:
@@ -91,6 +234,21 @@ class TaskmasterWebHandler(SimpleHTTPRequestHandler):
         except Exception as e:
             self.send_error(500, f'Error: {str(e)}')
 
+    def not_modified(self, etag, mtime):
+        """Check the request's conditional headers against a file's validators"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in (tag.strip() for tag in if_none_match.split(',')) or if_none_match.strip() == '*'
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            # HTTP dates have whole-second resolution
+            return int(mtime) <= since
+        return False
+
     def handle_command(self, query_params):
         """Handle Taskmaster API commands"""
         cmd_list = query_params.get('cmd', [])
@@ -100,23 +258,41 @@ class TaskmasterWebHandler(SimpleHTTPRequestHandler):
             return
         
         cmd_parts = cmd_list[0].split()
+        if not cmd_parts or cmd_parts[0] not in _DAEMON_COMMANDS:
+            self.send_error(400, 'Unknown command')
+            return
+        cacheable = cmd_parts[0] in _CACHEABLE_COMMANDS
         
         try:
-            # Forward command to Taskmaster server
-            response = self.client.send_command(cmd_parts)
-            
-            if not response:
-                response = {
-                    'status': 'error',
-                    'message': 'Failed to communicate with Taskmaster server',
-                    'timestamp': datetime.now().isoformat()
-                }
+            if cacheable:
+                key = response_key(cmd_parts)
+                body, generation = cached_response(key)
+            else:
+                body = None
+            if body is None:
+                # Forward command to Taskmaster server
+                response = self.client.send_command(cmd_parts)
+                if not cacheable:
+                    clear_responses()
+                
+                if not response:
+                    body = _dumps({
+                        'status': 'error',
+                        'message': 'Failed to communicate with Taskmaster server',
+                        'timestamp': datetime.now().isoformat()
+                    })
+                else:
+                    body = _dumps(response)
+                    # Error replies, e.g. an unknown program, pass through
+                    # uncached, so only existing programs ever get an entry.
+                    if cacheable and response.get('status') == 'success':
+                        store_response(key, body, generation)
             
             # Send response
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
             self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(body)
             
         except Exception as e:
             logger.error(f"Error processing command: {str(e)}")
@@ -128,30 +304,11 @@ class TaskmasterWebHandler(SimpleHTTPRequestHandler):
             self.send_response(500)
             self.send_header('Content-type', 'application/json')
             self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode())
+            self.wfile.write(_dumps(error_response))
 
-    def guess_type(self, path):
+    def guess_type(self, path, _get=_MIME_TYPES.get):
         """Guess the MIME type based on file extension"""
-        base, ext = os.path.splitext(path)
-        if ext == '.html':
-            return 'text/html'
-        elif ext == '.css':
-            return 'text/css'
-        elif ext == '.js':
-            return 'application/javascript'
-        elif ext in ('.jpg', '.jpeg'):
-            return 'image/jpeg'
-        elif ext == '.png':
-            return 'image/png'
-        elif ext == '.gif':
-            return 'image/gif'
-        elif ext == '.ico':
-            return 'image/x-icon'
-        elif ext == '.svg':
-            return 'image/svg+xml'
-        elif ext == '.json':
-            return 'application/json'
-        return 'application/octet-stream'
+        return _get(os.path.splitext(path)[1], 'application/octet-stream')
 
 def main():
     """Main entry point"""
@@ -186,11 +343,16 @@ def main():
         web_host = webui_config.get('host', '127.0.0.1')
         web_port = webui_config.get('port', 8080)
         
+        # Index the dashboard files now rather than on the first request
+        static_index(WEB_ROOT)
+
         # Create custom handler with access to config and client
         handler = lambda *args, **kwargs: TaskmasterWebHandler(*args, config=config, client=client, **kwargs)
         
-        # Start web server
-        web_server = HTTPServer((web_host, web_port), handler)
+        # Start web server; each request gets its own (daemon) thread so a
+        # slow command or log transfer does not hold up other clients. The
+        # client serializes commands over its kept-alive connection.
+        web_server = ThreadingHTTPServer((web_host, web_port), handler)
         logger.info(f"Starting Taskmaster Web Server on http://{web_host}:{web_port}")
         logger.info(f"Connected to Taskmaster server at {server_config.get('host')}:{server_config.get('port')} using {server_config.get('type')}")
         